@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import argparse
+import io
 import json
 import os
 import shutil
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
 
@@ -14,6 +16,8 @@ from pathlib import Path
 REPO_ROOT = Path(__file__).resolve().parents[2]
 VITE_PROJECT_DIR = REPO_ROOT / "src" / "orchestrator" / "vite"
 DEFAULT_TEMPLATE_DIR = REPO_ROOT / "template" / "app"
+_BASE_ENV = os.environ.copy()
+_PIPE_BUFSIZE = 1 << 16
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -130,17 +134,67 @@ def build_assets(temp_compile: Path, runtime_root: Path) -> None:
         raise RuntimeError(f"Missing entries manifest: {entries_manifest}")
     print(f"[orchestrator] entries_manifest={entries_manifest}", flush=True)
 
-    env = os.environ.copy()
-    env["VITE_ROOT"] = str(VITE_PROJECT_DIR)
-    env["ROUTES_DIR"] = str(entries_dir)
-    env["ROUTES_MANIFEST"] = str(entries_manifest)
-    env["OUT_DIR"] = str(runtime_root / "assets")
+    env = build_vite_env(entries_dir, entries_manifest, runtime_root)
 
     npm_cmd = ["npm", "install"]
-    subprocess.run(npm_cmd, cwd=str(VITE_PROJECT_DIR), check=True, env=env)
+    run_logged(npm_cmd, cwd=VITE_PROJECT_DIR, env=env)
 
     build_cmd = ["npm", "run", "build"]
-    subprocess.run(build_cmd, cwd=str(VITE_PROJECT_DIR), check=True, env=env)
+    run_logged(build_cmd, cwd=VITE_PROJECT_DIR, env=env)
+
+
+def build_vite_env(entries_dir: Path, entries_manifest: Path, runtime_root: Path) -> dict[str, str]:
+    """Build environment variables for Vite builds."""
+    return _BASE_ENV | {
+        "VITE_ROOT": str(VITE_PROJECT_DIR),
+        "ROUTES_DIR": str(entries_dir),
+        "ROUTES_MANIFEST": str(entries_manifest),
+        "OUT_DIR": str(runtime_root / "assets"),
+    }
+
+
+def run_logged(cmd: list[str], *, cwd: Path, env: dict[str, str]) -> None:
+    """Run a command to completion, forwarding its piped output."""
+    process, forwarder = _spawn_logged(cmd, cwd=cwd, env=env)
+    return_code = process.wait()
+    # Drain the pipe before returning so npm output lands ahead of our own logs.
+    forwarder.join()
+    if return_code != 0:
+        raise subprocess.CalledProcessError(return_code, cmd)
+
+
+def start_logged(cmd: list[str], *, cwd: Path, env: dict[str, str]) -> subprocess.Popen[bytes]:
+    """Start a command with stdout/stderr piped to a forwarding thread."""
+    process, _ = _spawn_logged(cmd, cwd=cwd, env=env)
+    return process
+
+
+def _spawn_logged(
+    cmd: list[str], *, cwd: Path, env: dict[str, str]
+) -> tuple[subprocess.Popen[bytes], threading.Thread]:
+    """Start a command and the thread that forwards its piped output."""
+    process = subprocess.Popen(
+        cmd,
+        cwd=str(cwd),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=_PIPE_BUFSIZE,
+    )
+    forwarder = threading.Thread(target=forward_output, args=(process.stdout,), daemon=True)
+    forwarder.start()
+    return process, forwarder
+
+
+def forward_output(stream: io.BufferedIOBase) -> None:
+    """Copy child output to stdout, flushing per read1() batch rather than per line."""
+    out = sys.stdout.buffer
+    with stream:
+        # read1 returns whatever the pipe holds (up to 64 KiB), so a flush per
+        # chunk stays cheap and long-running watchers still show output promptly.
+        for chunk in iter(lambda: stream.read1(_PIPE_BUFSIZE), b""):
+            out.write(chunk)
+            out.flush()
 
 
 def build_route_entries(routes_dir: Path, entries_dir: Path, template_dir: Path) -> None:
@@ -203,9 +257,9 @@ def build_route_entries(routes_dir: Path, entries_dir: Path, template_dir: Path)
         entry_key = rel_path.as_posix().removesuffix(".tsx")
         entries[entry_key] = str(dest)
 
-    (template_dir / "entries.json").write_text(
-        json.dumps(entries, indent=2),
-        encoding="utf-8",
+    # Machine-consumed by vite.config.ts, so skip pretty-printing.
+    (template_dir / "entries.json").write_bytes(
+        json.dumps(entries, separators=(",", ":")).encode("utf-8")
     )
 
 
@@ -221,12 +275,13 @@ def assemble_runtime(temp_compile: Path, runtime_root: Path) -> None:
     routing_dir.mkdir(parents=True, exist_ok=True)
 
     for route_path in routes_dir.rglob("*"):
-        if not route_path.is_file():
+        name = route_path.name
+        if not name.endswith((".py", ".tsx")) or not route_path.is_file():
             continue
         rel_path = route_path.relative_to(routes_dir)
-        if route_path.suffix == ".py":
+        if name.endswith(".py"):
             dest = endpoint_dir / rel_path
-        elif route_path.suffix == ".tsx":
+        elif name.endswith(".tsx"):
             dest = routing_dir / rel_path
         else:
             continue
@@ -323,21 +378,18 @@ def watch_orchestrator(
             ):
                 continue
 
-            tsx_changed, tsx_set_changed = diff_tsx_changes(routes_snapshot, new_routes)
+            _, tsx_set_changed = diff_tsx_changes(routes_snapshot, new_routes)
             sync_runtime(
                 template_dir=template_dir,
                 temp_compile=temp_compile,
                 runtime_root=runtime_root,
             )
 
-            if tsx_changed:
-                build_route_entries(
-                    temp_compile / "template" / "routes",
-                    temp_compile / "template" / "__entries__",
-                    temp_compile / "template",
-                )
-
-            if tsx_set_changed and not args.skip_build:
+            # Edits to existing pages are picked up by Vite's own watcher; the
+            # entry files only depend on the set of pages, and Rollup fixes its
+            # inputs at startup, so restart only when that set changes.
+            vite_exited = vite_process is not None and vite_process.poll() is not None
+            if (tsx_set_changed or vite_exited) and not args.skip_build:
                 if vite_process is not None:
                     stop_process(vite_process)
                 vite_process = start_vite_watch(temp_compile, runtime_root)
@@ -368,18 +420,18 @@ def start_server(runtime_root: Path) -> subprocess.Popen[bytes]:
 
 def build_runtime_env(runtime_root: Path) -> dict[str, str]:
     """Build environment variables for the runtime server."""
-    env = os.environ.copy()
-    env["TSUNAMI_ENDPOINT_DIR"] = str(runtime_root / "endpoint")
-    env["TSUNAMI_ROUTING_DIR"] = str(runtime_root / "routing")
-    env["TSUNAMI_ASSETS_DIR"] = str(runtime_root / "assets")
-    env["TSUNAMI_INIT_PATH"] = str(runtime_root / "init.py")
-    env["PYTHONPATH"] = os.pathsep.join(
-        [
-            str(REPO_ROOT / "src" / "python_module"),
-            str(REPO_ROOT / "src"),
-        ]
-    )
-    return env
+    return _BASE_ENV | {
+        "TSUNAMI_ENDPOINT_DIR": str(runtime_root / "endpoint"),
+        "TSUNAMI_ROUTING_DIR": str(runtime_root / "routing"),
+        "TSUNAMI_ASSETS_DIR": str(runtime_root / "assets"),
+        "TSUNAMI_INIT_PATH": str(runtime_root / "init.py"),
+        "PYTHONPATH": os.pathsep.join(
+            [
+                str(REPO_ROOT / "src" / "python_module"),
+                str(REPO_ROOT / "src"),
+            ]
+        ),
+    }
 
 
 def start_vite_watch(temp_compile: Path, runtime_root: Path) -> subprocess.Popen[bytes]:
@@ -393,17 +445,29 @@ def start_vite_watch(temp_compile: Path, runtime_root: Path) -> subprocess.Popen
     if not entries_manifest.exists():
         raise RuntimeError(f"Missing entries manifest: {entries_manifest}")
 
-    env = os.environ.copy()
-    env["VITE_ROOT"] = str(VITE_PROJECT_DIR)
-    env["ROUTES_DIR"] = str(entries_dir)
-    env["ROUTES_MANIFEST"] = str(entries_manifest)
-    env["OUT_DIR"] = str(runtime_root / "assets")
+    env = build_vite_env(entries_dir, entries_manifest, runtime_root)
 
-    npm_cmd = ["npm", "install"]
-    subprocess.run(npm_cmd, cwd=str(VITE_PROJECT_DIR), check=True, env=env)
+    if not npm_install_current(VITE_PROJECT_DIR):
+        npm_cmd = ["npm", "install"]
+        run_logged(npm_cmd, cwd=VITE_PROJECT_DIR, env=env)
 
     cmd = ["npm", "run", "build", "--", "--watch"]
-    return subprocess.Popen(cmd, cwd=str(VITE_PROJECT_DIR), env=env)
+    return start_logged(cmd, cwd=VITE_PROJECT_DIR, env=env)
+
+
+def npm_install_current(project_dir: Path) -> bool:
+    """Return True when node_modules is newer than the package manifests."""
+    try:
+        installed = (project_dir / "node_modules" / ".package-lock.json").stat().st_mtime_ns
+    except OSError:
+        return False
+    for name in ("package.json", "package-lock.json"):
+        try:
+            if (project_dir / name).stat().st_mtime_ns > installed:
+                return False
+        except OSError:
+            continue
+    return True
 
 
 def wait_for_manifest(assets_dir: Path, *, timeout: float = 30.0) -> None:
@@ -421,8 +485,8 @@ def snapshot_template(
     template_dir: Path,
 ) -> tuple[dict[str, int], dict[str, int], dict[str, int], dict[str, int]]:
     """Snapshot relevant template files by relative path and mtime."""
-    routes_snapshot = snapshot_paths(template_dir / "routes", suffixes={".py", ".tsx"})
-    components_snapshot = snapshot_paths(template_dir / "components", suffixes={".ts", ".tsx", ".css"})
+    routes_snapshot = snapshot_paths(template_dir / "routes", suffixes=(".py", ".tsx"))
+    components_snapshot = snapshot_paths(template_dir / "components", suffixes=(".ts", ".tsx", ".css"))
     utils_snapshot = snapshot_paths(template_dir / "utils", suffixes=None)
 
     misc_snapshot: dict[str, int] = {}
@@ -436,15 +500,15 @@ def snapshot_template(
     return routes_snapshot, components_snapshot, utils_snapshot, misc_snapshot
 
 
-def snapshot_paths(root: Path, *, suffixes: set[str] | None) -> dict[str, int]:
+def snapshot_paths(root: Path, *, suffixes: tuple[str, ...] | None) -> dict[str, int]:
     """Return {relative_path: mtime_ns} for files in root."""
     snapshot: dict[str, int] = {}
     if not root.exists():
         return snapshot
     for path in root.rglob("*"):
-        if not path.is_file():
+        if suffixes is not None and not path.name.endswith(suffixes):
             continue
-        if suffixes is not None and path.suffix not in suffixes:
+        if not path.is_file():
             continue
         try:
             snapshot[path.relative_to(root).as_posix()] = path.stat().st_mtime_ns
@@ -458,11 +522,14 @@ def diff_tsx_changes(
     after: dict[str, int],
 ) -> tuple[bool, bool]:
     """Return (tsx_changed, tsx_set_changed) based on route snapshots."""
-    before_tsx = {k: v for k, v in before.items() if k.endswith(".tsx")}
-    after_tsx = {k: v for k, v in after.items() if k.endswith(".tsx")}
-    tsx_set_changed = set(before_tsx) != set(after_tsx)
-    tsx_changed = tsx_set_changed or before_tsx != after_tsx
-    return tsx_changed, tsx_set_changed
+    before_tsx_keys = {k for k in before if k.endswith(".tsx")}
+    after_tsx_keys = {k for k in after if k.endswith(".tsx")}
+    if before_tsx_keys != after_tsx_keys:
+        return True, True
+    for k in before_tsx_keys:
+        if before[k] != after[k]:
+            return True, False
+    return False, False
 
 
 def sync_runtime(*, template_dir: Path, temp_compile: Path, runtime_root: Path) -> None:
@@ -471,14 +538,14 @@ def sync_runtime(*, template_dir: Path, temp_compile: Path, runtime_root: Path)
     compile_routes = temp_compile / "template" / "routes"
     compile_utils = temp_compile / "template" / "utils"
 
-    sync_dir(template_routes, compile_routes, suffixes={".py", ".tsx"})
-    sync_dir(template_routes, runtime_root / "endpoint", suffixes={".py"})
-    sync_dir(template_routes, runtime_root / "routing", suffixes={".tsx"})
+    sync_dir(template_routes, compile_routes, suffixes=(".py", ".tsx"))
+    sync_dir(template_routes, runtime_root / "endpoint", suffixes=(".py",))
+    sync_dir(template_routes, runtime_root / "routing", suffixes=(".tsx",))
 
     sync_dir(
         template_dir / "components",
         temp_compile / "template" / "components",
-        suffixes={".ts", ".tsx", ".css"},
+        suffixes=(".ts", ".tsx", ".css"),
     )
 
     sync_dir(template_dir / "utils", runtime_root / "utils", suffixes=None)
@@ -501,7 +568,7 @@ def sync_file(src: Path, dst: Path) -> None:
     shutil.copy2(src, dst)
 
 
-def sync_dir(src: Path, dst: Path, *, suffixes: set[str] | None) -> None:
+def sync_dir(src: Path, dst: Path, *, suffixes: tuple[str, ...] | None) -> None:
     """Mirror src into dst, deleting files that no longer exist."""
     if not src.exists():
         if dst.exists():
@@ -510,9 +577,9 @@ def sync_dir(src: Path, dst: Path, *, suffixes: set[str] | None) -> None:
 
     src_files: set[str] = set()
     for path in src.rglob("*"):
-        if not path.is_file():
+        if suffixes is not None and not path.name.endswith(suffixes):
             continue
-        if suffixes is not None and path.suffix not in suffixes:
+        if not path.is_file():
             continue
         rel = path.relative_to(src).as_posix()
         src_files.add(rel)
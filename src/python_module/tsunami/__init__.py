@@ -1,3 +1,3 @@
 """Tsunami public API."""
 
-from routing.endpoints import Endpoint, mount_api, params  # noqa: F401
+from routing.endpoints import Endpoint, JsonStream, mount_api, params, set_json_encoder  # noqa: F401
@@ -3,17 +3,22 @@
 from __future__ import annotations
 
 import inspect
+import os
 import re
 import sys
 import threading
 import time
+import uuid
+from contextlib import contextmanager
 from dataclasses import asdict, is_dataclass, fields as dc_fields
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import (
     Any,
     Annotated,
     Callable,
     Generic,
+    Iterable,
+    Iterator,
     ParamSpec,
     TypeVar,
     get_args,
@@ -29,15 +34,18 @@ from sqlalchemy import (
     Column,
     DateTime,
     Float,
+    Index,
     Integer,
     MetaData,
     Table as SATable,
     Text,
+    UniqueConstraint,
     bindparam,
     create_engine,
     insert,
     select,
     text,
+    false,
     delete, 
     tuple_,
     exists as sa_exists, 
@@ -47,7 +55,7 @@ from sqlalchemy import (
     or_
 )
 from sqlalchemy.dialects.postgresql import insert as pg_insert
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import class_mapper, registry
 from sqlalchemy.orm.exc import UnmappedClassError
 from sqlalchemy.schema import CreateIndex, CreateTable
@@ -65,7 +73,7 @@ R = TypeVar("R")
 
 
 # ======================================================================================
-# Field markers: db.Key[T], db.Unique[T]
+# Field markers: db.Key[T], db.Unique[T], db.Indexed[T], db.Searchable[T], db.Now[T]
 # (generic classes, not PEP695 type aliases => reliable at runtime)
 # ======================================================================================
 
@@ -82,9 +90,31 @@ class Unique(Generic[K]):
     __db_marker__ = "unique"
 
 
+class Indexed(Generic[K]):
+    """Marker wrapper indicating a non-unique B-tree indexed field."""
+    __db_marker__ = "indexed"
+
+
+class Searchable(Generic[K]):
+    """Marker wrapper indicating a text field with a GIN full-text index."""
+    __db_marker__ = "searchable"
+
+
+class Now(Generic[K]):
+    """Marker wrapper indicating a NOT NULL timestamp the database fills with now()."""
+    __db_marker__ = "now"
+
+
 # optional lowercase aliases
 key = Key
 unique = Unique
+indexed = Indexed
+searchable = Searchable
+now = Now
+
+# Text search config shared by the GIN index expression and search() so the
+# planner can match the query against the index.
+_TS_CONFIG = "simple"
 
 
 def _unwrap_aliases(tp: Any) -> Any:
@@ -98,23 +128,26 @@ def _unwrap_aliases(tp: Any) -> Any:
     return tp
 
 
-def _analyze_type(tp: Any) -> tuple[Any, bool, bool, bool]:
+def _analyze_type(tp: Any) -> tuple[Any, bool, bool, bool, bool, bool, bool]:
     """
-    returns: (base_type, nullable, is_pk, is_unique)
+    returns: (base_type, nullable, is_pk, is_unique, is_indexed, is_searchable, is_now)
 
     Supports:
       - PEP 695 alias: `type NoteId = int`
       - NewType
       - Annotated[T, marker...]
-      - Key[T] / Unique[T] generic wrappers
+      - Key[T] / Unique[T] / Indexed[T] / Searchable[T] / Now[T] generic wrappers
       - Optional[T] / T | None
     """
     is_pk = False
     is_unique = False
+    is_indexed = False
+    is_searchable = False
+    is_now = False
 
     def walk(t: Any) -> tuple[Any, bool]:
         """Walk nested annotations to identify flags and base type."""
-        nonlocal is_pk, is_unique
+        nonlocal is_pk, is_unique, is_indexed, is_searchable, is_now
 
         t = _unwrap_aliases(t)
         origin = get_origin(t)
@@ -129,9 +162,15 @@ def _analyze_type(tp: Any) -> tuple[Any, bool, bool, bool]:
                     is_pk = True
                 elif tag == "unique":
                     is_unique = True
+                elif tag == "indexed":
+                    is_indexed = True
+                elif tag == "searchable":
+                    is_searchable = True
+                elif tag == "now":
+                    is_now = True
             return walk(base)
 
-        # Key[T] / Unique[T] wrapper (robust across duplicate imports)
+        # Key[T] / Unique[T] / Indexed[T] / Searchable[T] / Now[T] wrapper (robust across duplicate imports)
         if origin is not None:
             tag = getattr(origin, "__db_marker__", None)
             if tag == "key":
@@ -142,6 +181,18 @@ def _analyze_type(tp: Any) -> tuple[Any, bool, bool, bool]:
                 is_unique = True
                 base = args[0] if args else Any
                 return walk(base)
+            if tag == "indexed":
+                is_indexed = True
+                base = args[0] if args else Any
+                return walk(base)
+            if tag == "searchable":
+                is_searchable = True
+                base = args[0] if args else Any
+                return walk(base)
+            if tag == "now":
+                is_now = True
+                base = args[0] if args else Any
+                return walk(base)
 
         # Optional[T] / T | None
         if origin is not None and type(None) in args:
@@ -152,7 +203,28 @@ def _analyze_type(tp: Any) -> tuple[Any, bool, bool, bool]:
         return t, False
 
     base, nullable = walk(tp)
-    return base, nullable, is_pk, is_unique
+    return base, nullable, is_pk, is_unique, is_indexed, is_searchable, is_now
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 v7) for primary keys.
+
+    New keys sort after older ones, so inserts land on the right-most B-tree page
+    instead of random pages as with uuid4().
+    """
+    native = getattr(uuid, "uuid7", None)  # Python 3.14+
+    if native is not None:
+        return native()
+
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (ms & ((1 << 48) - 1)) << 80        # 48-bit unix_ts_ms
+    value |= 0x7 << 76                          # version
+    value |= ((rand >> 68) & 0xFFF) << 64       # rand_a (12 bits)
+    value |= 0b10 << 62                         # variant
+    value |= rand & ((1 << 62) - 1)             # rand_b (62 bits)
+    return uuid.UUID(int=value)
 
 
 # ======================================================================================
@@ -195,13 +267,48 @@ class DB:
         self.engine = engine
 
     @classmethod
-    def from_url(cls, url: str, *, echo: bool = False) -> "DB":
-        """Create a DB wrapper around a SQLAlchemy engine."""
+    def from_url(
+        cls,
+        url: str,
+        *,
+        echo: bool = False,
+        prepare_threshold: int | None = 0,
+        pool_size: int = 10,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+    ) -> "DB":
+        """
+        Create a DB wrapper around a SQLAlchemy engine.
+
+        SQLAlchemy caches the compiled SQL for each statement shape. With the psycopg
+        driver, prepare_threshold also makes the server keep a prepared plan per pooled
+        connection after that many executions (0 = on first use, None = never, e.g.
+        behind a transaction-pooling pgbouncer).
+
+        Queries check connections out of the engine's pool per call. pool_size defaults
+        to CherryPy's default worker count (server.thread_pool = 10) so every worker can
+        hold one without waiting; max_overflow covers bursts from background threads.
+        """
+        parsed = make_url(url)
+        connect_args: dict[str, Any] = {}
+        if parsed.get_driver_name() == "psycopg":
+            connect_args["prepare_threshold"] = prepare_threshold
+
+        pool_args: dict[str, Any] = {}
+        if parsed.get_backend_name() != "sqlite":
+            pool_args = {
+                "pool_size": pool_size,
+                "max_overflow": max_overflow,
+                "pool_recycle": pool_recycle,
+            }
+
         engine = create_engine(
             url,
             echo=echo,
             future=True,
             pool_pre_ping=True,
+            connect_args=connect_args,
+            **pool_args,
         )
         return cls(engine)
 
@@ -229,9 +336,18 @@ def init_db(
     attempts: int = 60,
     sleep_s: float = 1.0,
     sync: bool = True,
+    prepare_threshold: int | None = 0,
+    pool_size: int = 10,
+    max_overflow: int = 10,
 ) -> DB:
     """Initialize the engine, bind it globally, and optionally sync schema."""
-    db = DB.from_url(url, echo=echo)
+    db = DB.from_url(
+        url,
+        echo=echo,
+        prepare_threshold=prepare_threshold,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+    )
     bind_db(db)
 
     if wait:
@@ -269,7 +385,7 @@ def _unwrap_to_base(tp: Any) -> Any:
 
     if origin is not None:
         tag = getattr(origin, "__db_marker__", None)
-        if tag in ("key", "unique"):
+        if tag in ("key", "unique", "indexed", "searchable", "now"):
             base = args[0] if args else Any
             return _unwrap_to_base(base)
 
@@ -333,16 +449,24 @@ class Schema:
                     conn.execute(CreateIndex(idx))
 
     @overload
-    def table(self, cls: type[T], *, name: str | None = None) -> type[T]:
+    def table(
+        self, cls: type[T], *, name: str | None = None, unique: Sequence[tuple[str, ...]] = ()
+    ) -> type[T]:
         """Type overload for direct decoration usage."""
         ...
     @overload
-    def table(self, cls: None = None, *, name: str | None = None) -> Callable[[type[T]], type[T]]:
+    def table(
+        self, cls: None = None, *, name: str | None = None, unique: Sequence[tuple[str, ...]] = ()
+    ) -> Callable[[type[T]], type[T]]:
         """Type overload for decorator factory usage."""
         ...
 
-    def table(self, cls=None, *, name: str | None = None):
-        """Register a @dataclass model with the schema and SQLAlchemy mapping."""
+    def table(self, cls=None, *, name: str | None = None, unique: Sequence[tuple[str, ...]] = ()):
+        """
+        Register a @dataclass model with the schema and SQLAlchemy mapping.
+
+        unique lists multi-column unique constraints, e.g. unique=[("book_title", "note_id")].
+        """
         def deco(model: type[T]) -> type[T]:
             """Decorate a dataclass to create and map its SQL table."""
             if not is_dataclass(model):
@@ -355,18 +479,23 @@ class Schema:
             globalns = vars(mod) if mod else {}
             hints = get_type_hints(model, globalns=globalns, localns=None, include_extras=True)
 
-            analyzed: list[tuple[str, Any, bool, bool, bool]] = []
+            analyzed: list[tuple[str, Any, bool, bool, bool, bool, bool]] = []
+            searchable_cols: list[str] = []
             for f in dc_fields(model):
                 if f.init is False:
                     continue
                 tp = hints.get(f.name, f.type)
-                base_type, is_nullable, is_pk, is_unique = _analyze_type(tp)
-                analyzed.append((f.name, base_type, is_nullable, is_pk, is_unique))
+                base_type, is_nullable, is_pk, is_unique, is_indexed, is_searchable, is_now = _analyze_type(tp)
+                analyzed.append((f.name, base_type, is_nullable, is_pk, is_unique, is_indexed, is_now))
+                if is_searchable:
+                    searchable_cols.append(f.name)
 
             cols: list[Column] = []
-            for col_name, base_type, is_nullable, is_pk, is_unique in analyzed:
+            for col_name, base_type, is_nullable, is_pk, is_unique, is_indexed, is_now in analyzed:
                 sa_type = _sa_type_for(base_type)
-                nullable = False if is_pk else is_nullable
+                # Now[T] fields are Optional on the dataclass so callers can omit
+                # them, but the column itself is always filled by the default.
+                nullable = False if (is_pk or is_now) else is_nullable
                 cols.append(
                     Column(
                         col_name,
@@ -374,6 +503,9 @@ class Schema:
                         primary_key=is_pk,
                         nullable=nullable,
                         unique=is_unique,
+                        # unique/pk columns already get an index
+                        index=is_indexed and not (is_unique or is_pk),
+                        server_default=func.now() if is_now else None,
                     )
                 )
 
@@ -390,6 +522,16 @@ class Schema:
 
             sa_table = SATable(table_name, self.metadata, *cols, extend_existing=True)
 
+            for col_name in searchable_cols:
+                ix_name = f"ix_{table_name}_{col_name}_tsv"
+                if not any(ix.name == ix_name for ix in sa_table.indexes):
+                    Index(ix_name, _tsvector(sa_table.c[col_name]), postgresql_using="gin")
+
+            for uq_cols in unique:
+                uq_name = f"uq_{table_name}_{'_'.join(uq_cols)}"
+                if not any(c.name == uq_name for c in sa_table.constraints):
+                    sa_table.append_constraint(UniqueConstraint(*uq_cols, name=uq_name))
+
             # Map only if this class isn't already mapped
             try:
                 class_mapper(model)
@@ -417,12 +559,12 @@ def table(cls: type[T]) -> type[T]:
     """Type overload for direct decoration usage."""
     ...
 @overload
-def table(*, name: str | None = None) -> Callable[[type[T]], type[T]]:
+def table(*, name: str | None = None, unique: Sequence[tuple[str, ...]] = ()) -> Callable[[type[T]], type[T]]:
     """Type overload for decorator factory usage."""
     ...
-def table(cls=None, *, name: str | None = None):
+def table(cls=None, *, name: str | None = None, unique: Sequence[tuple[str, ...]] = ()):
     """Public decorator helper that forwards to schema.table()."""
-    return schema.table(cls, name=name)
+    return schema.table(cls, name=name, unique=unique)
 
 
 # ======================================================================================
@@ -434,13 +576,27 @@ _TLS = threading.local()
 
 class QueryPlan:
     """Immutable plan describing a SQL operation and how to materialize results."""
-    def __init__(self, *, kind: str, stmt: Any, mode: str, model: type | None = None, cast: Any = None):
-        """Store the statement, execution mode, and optional cast info."""
+    def __init__(
+        self,
+        *,
+        kind: str,
+        stmt: Any,
+        mode: str,
+        model: type | None = None,
+        cast: Any = None,
+        params: list[dict[str, Any]] | None = None,
+        chunk_size: int | None = None,
+        rows: Iterable[tuple[Any, ...]] | None = None,
+    ):
+        """Store the statement, execution mode, optional cast info, and multi-row insert/COPY rows."""
         self.kind = kind
         self.stmt = stmt
         self.mode = mode
         self.model = model
         self.cast = cast
+        self.params = params
+        self.chunk_size = chunk_size
+        self.rows = rows
 
 
 class QueryBuilder:
@@ -482,6 +638,11 @@ class QueryBuilder:
         self._stmt = self._stmt.join(other_tbl, onclause=when, isouter=isouter)
         return self
 
+    def distinct(self):
+        """Apply DISTINCT to the selected columns."""
+        self._stmt = self._stmt.distinct()
+        return self
+
     def limit(self, n: int):
         """Limit the number of rows returned."""
         self._stmt = self._stmt.limit(n)
@@ -492,9 +653,33 @@ class QueryBuilder:
         self._stmt = self._stmt.order_by(*cols)
         return self
 
+    def _row_model(self) -> type | None:
+        """Return the model rows map onto, or None when a projection returns plain dicts."""
+        return self.model if self._select_cols is None else None
+
     def fetch_all(self) -> QueryPlan:
         """Return a query plan that fetches all rows."""
-        plan = QueryPlan(kind="select", stmt=self._stmt, mode="all", model=self.model)
+        plan = QueryPlan(kind="select", stmt=self._stmt, mode="all", model=self._row_model())
+        _TLS.last_plan = plan
+        return plan
+
+    def fetch_scalars(self) -> QueryPlan:
+        """Return a plan that fetches the first selected column of every row as a flat list."""
+        plan = QueryPlan(kind="select", stmt=self._stmt, mode="scalars")
+        _TLS.last_plan = plan
+        return plan
+
+    def fetch_columns(self) -> QueryPlan:
+        """Return a plan that fetches all rows column-wise as {column: [values...]}."""
+        plan = QueryPlan(kind="select", stmt=self._stmt, mode="columns")
+        _TLS.last_plan = plan
+        return plan
+
+    def fetch_iter(self, chunk_size: int = 1000) -> QueryPlan:
+        """Return a plan that streams rows through a server-side cursor, chunk_size at a time."""
+        plan = QueryPlan(
+            kind="select", stmt=self._stmt, mode="iter", model=self._row_model(), chunk_size=chunk_size
+        )
         _TLS.last_plan = plan
         return plan
 
@@ -505,13 +690,13 @@ class QueryBuilder:
 
     def fetch_first(self) -> QueryPlan:
         """Return a plan that fetches the first row or None."""
-        plan = QueryPlan(kind="select", stmt=self._stmt, mode="first", model=self.model)
+        plan = QueryPlan(kind="select", stmt=self._stmt, mode="first", model=self._row_model())
         _TLS.last_plan = plan
         return plan
 
     def fetch_one(self) -> QueryPlan:
         """Return a plan that expects exactly one row."""
-        plan = QueryPlan(kind="select", stmt=self._stmt, mode="one", model=self.model)
+        plan = QueryPlan(kind="select", stmt=self._stmt, mode="one", model=self._row_model())
         _TLS.last_plan = plan
         return plan
     
@@ -589,6 +774,32 @@ class QueryBuilder:
 
         return self.where(or_(*exprs))
 
+    def search(self, query: str, *, on: Any, prefix: bool = False):
+        """
+        Full-text match against a db.Searchable column using its GIN index.
+
+        Example:
+          notes.search("foo bar", on=notes.title).fetch_all()
+
+        Produces:
+          WHERE to_tsvector('simple', title) @@ plainto_tsquery('simple', 'foo bar')
+
+        With prefix=True every word matches as a prefix ('foo:* & bar:*').
+        """
+        if isinstance(on, str):
+            on = self._table.c[on]
+
+        config = _ts_config()
+        if prefix:
+            words = re.findall(r"\w+", query)
+            if not words:
+                return self.where(false())
+            tsquery = func.to_tsquery(config, " & ".join(f"{w}:*" for w in words))
+        else:
+            tsquery = func.plainto_tsquery(config, query)
+
+        return self.where(_tsvector(on).op("@@")(tsquery))
+
     def exists(self) -> QueryPlan:
         """Return a plan that checks existence of matching rows."""
         inner = select(1).select_from(self._table)
@@ -623,6 +834,7 @@ class QueryBuilder:
 
         tbl = self.model.__table__
         pk_cols = [c.name for c in tbl.primary_key.columns]
+        _drop_db_defaults(tbl, [data])
 
         pk_missing = any((k not in data) or (data.get(k) is None) for k in pk_cols)
         if pk_missing:
@@ -649,6 +861,60 @@ class QueryBuilder:
         _TLS.last_plan = plan
         return plan
 
+    def insert_many(self, objs: Sequence[Any]) -> QueryPlan:
+        """
+        Bulk upsert (Postgres) as multi-row INSERT .. VALUES (...), (...) statements,
+        one per chunk of rows that fits the bind-parameter limit:
+          - if every row has its PK value(s) -> INSERT .. ON CONFLICT (pk) DO UPDATE
+          - otherwise -> plain INSERT (DB must generate missing PKs)
+        """
+        rows = [asdict(o) if is_dataclass(o) else dict(o) for o in objs]
+
+        tbl = self.model.__table__
+        pk_cols = [c.name for c in tbl.primary_key.columns]
+        _drop_db_defaults(tbl, rows)
+
+        pk_missing = any(row.get(k) is None for row in rows for k in pk_cols)
+        if pk_missing or not rows:
+            for row in rows:
+                for k in pk_cols:
+                    if row.get(k) is None:
+                        row.pop(k, None)
+            stmt = insert(tbl)
+        else:
+            ins = pg_insert(tbl)
+            set_cols = {k: getattr(ins.excluded, k) for k in rows[0].keys() if k not in pk_cols}
+            if not set_cols:
+                stmt = ins.on_conflict_do_nothing(index_elements=[tbl.c[k] for k in pk_cols])
+            else:
+                stmt = ins.on_conflict_do_update(
+                    index_elements=[tbl.c[k] for k in pk_cols],
+                    set_=set_cols,
+                )
+
+        plan = QueryPlan(kind="insert", stmt=stmt, mode="rowcount", model=self.model, params=rows)
+        _TLS.last_plan = plan
+        return plan
+
+    def copy_rows(self, objs: Iterable[Any]) -> QueryPlan:
+        """
+        Bulk load with Postgres COPY ... FROM STDIN (plain insert, no upsert).
+
+        Columns with a database default (db.Now) are left out and filled by the server.
+
+        Rows are produced lazily from objs and streamed to the server as they come, so
+        a generator never needs to be materialized. Other drivers fall back to an
+        executemany INSERT.
+        """
+        cols = _copy_columns(self._table)
+        rows = (
+            tuple(getattr(o, c) for c in cols) if is_dataclass(o) else tuple(o.get(c) for c in cols)
+            for o in objs
+        )
+        plan = QueryPlan(kind="copy", stmt=insert(self._table), mode="rowcount", model=self.model, rows=rows)
+        _TLS.last_plan = plan
+        return plan
+
     def delete(self, target: Any = None, *, allow_all: bool = False) -> "QueryPlan":
         """
         Supports both styles:
@@ -710,6 +976,16 @@ class QueryBuilder:
         return plan
 
 
+def _tsvector(col: Any) -> Any:
+    """Build the to_tsvector expression shared by search indexes and queries."""
+    return func.to_tsvector(_ts_config(), col)
+
+
+def _ts_config() -> Any:
+    """Return the regconfig literal (text(), so Index() still attaches to the column's table)."""
+    return text(f"'{_TS_CONFIG}'::regconfig")
+
+
 class Table:
     """
     Usage:
@@ -733,6 +1009,67 @@ class Table:
         return False
 
 
+class UnitOfWork:
+    """
+    Run every @db.query on this thread inside one transaction.
+
+    Usage:
+      with db.UnitOfWork():
+          Queries.add_note(note)
+          Queries.update_notebook(book_title, note)
+
+    Commits on normal exit and rolls back on error. Nested units join the outer one.
+    The unit lives in thread-local state, never on the (shared) Endpoint instance.
+    """
+
+    def __init__(self, db: "DB | None" = None):
+        """Create a unit of work for the given or bound DB."""
+        self._db = db
+        self._outer = False
+        self.connection: Any = None
+        self._tx: Any = None
+
+    def __enter__(self) -> "UnitOfWork":
+        """Open a connection and transaction, or join the thread's active unit."""
+        active = getattr(_TLS, "uow", None)
+        if active is not None:
+            self._outer = True
+            return active
+
+        self.connection = (self._db or get_db()).engine.connect()
+        self._tx = self.connection.begin()
+        _TLS.uow = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        """Commit or roll back, then release the connection."""
+        if self._outer:
+            self._outer = False
+            return False
+
+        _TLS.uow = None
+        try:
+            if exc_type is None:
+                self._tx.commit()
+            else:
+                self._tx.rollback()
+        finally:
+            self.connection.close()
+            self.connection = None
+        return False
+
+
+@contextmanager
+def _connection(db: DB, *, write: bool) -> Iterator[Any]:
+    """Yield the active unit of work's connection, or a pooled one (in a transaction for writes)."""
+    uow = getattr(_TLS, "uow", None)
+    if uow is not None:
+        yield uow.connection
+        return
+    with (db.engine.begin() if write else db.engine.connect()) as conn:
+        yield conn
+
+
 def _row_to_kwargs(row: Any) -> dict[str, Any]:
     """Normalize SQLAlchemy row mappings into plain dicts."""
     out: dict[str, Any] = {}
@@ -745,6 +1082,16 @@ def _row_to_kwargs(row: Any) -> dict[str, Any]:
     return out
 
 
+@lru_cache(maxsize=None)
+def _tuple_fields(cls: type) -> frozenset[str]:
+    """Names of dataclass fields annotated as tuples (e.g. frozen result wrappers)."""
+    try:
+        hints = get_type_hints(cls)
+    except Exception:
+        return frozenset()
+    return frozenset(n for n, tp in hints.items() if tp is tuple or get_origin(tp) is tuple)
+
+
 def _coerce_return(value: Any, return_type: Any) -> Any:
     """Coerce return values into dataclass wrappers when appropriate."""
     if return_type in (None, inspect._empty, type(None)):
@@ -753,22 +1100,119 @@ def _coerce_return(value: Any, return_type: Any) -> Any:
     if isinstance(return_type, type) and is_dataclass(return_type):
         flds = dc_fields(return_type)
         names = {f.name for f in flds}
+        as_tuple = _tuple_fields(return_type)
+
+        if isinstance(value, dict) and len(flds) > 1 and names == value.keys():
+            # column-wise result (fetch_columns) into a struct-of-arrays container
+            return return_type(**{k: tuple(v) if k in as_tuple else v for k, v in value.items()})
 
         if len(flds) == 1:
+            if isinstance(value, list) and flds[0].name in as_tuple:
+                value = tuple(value)
             return return_type(**{flds[0].name: value})
 
         if "notes" in names:
+            seq = tuple if "notes" in as_tuple else list
             if value is None:
-                return return_type(notes=[])
+                return return_type(notes=seq())
             if isinstance(value, list):
-                return return_type(notes=value)
-            return return_type(notes=[value])
+                return return_type(notes=seq(value))
+            return return_type(notes=seq([value]))
 
     return value
 
 
+def _iter_rows(db: DB, plan: QueryPlan) -> Iterator[Any]:
+    """Yield mapped rows from a streaming select plan."""
+    make = plan.model if plan.model is not None and is_dataclass(plan.model) else None
+    with db.engine.connect() as conn:
+        # yield_per turns on stream_results (a named server-side cursor on psycopg)
+        res = conn.execution_options(yield_per=plan.chunk_size).execute(plan.stmt)
+        for row in res.mappings():
+            yield make(**_row_to_kwargs(row)) if make is not None else dict(row)
+
+
+# Bind parameters per statement: SQLite allows 32766, Postgres 65535.
+_MAX_BIND_PARAMS = 32766
+
+
+def _insert_chunks(stmt: Any, rows: list[dict[str, Any]]) -> Iterator[Any]:
+    """Yield one multi-row INSERT .. VALUES statement per chunk of rows under the bind limit."""
+    if not rows:
+        return
+    size = max(1, _MAX_BIND_PARAMS // max(1, len(rows[0])))
+    for i in range(0, len(rows), size):
+        yield stmt.values(rows[i:i + size])
+
+
+def _drop_db_defaults(tbl: SATable, rows: list[dict[str, Any]]) -> None:
+    """Omit server-defaulted columns that every row leaves as None, so the DB fills them."""
+    for col in tbl.columns:
+        if col.server_default is not None and all(row.get(col.name) is None for row in rows):
+            for row in rows:
+                row.pop(col.name, None)
+
+
+def _copy_columns(tbl: SATable) -> list[str]:
+    """Return the columns a COPY load writes (server-defaulted ones are left to the DB)."""
+    return [c.name for c in tbl.columns if c.server_default is None]
+
+
+def _copy_rows(conn: Any, plan: QueryPlan) -> int:
+    """Stream a copy plan's rows into its table and return how many were written."""
+    tbl = plan.stmt.table
+    cols = _copy_columns(tbl)
+    rows = plan.rows or ()
+
+    if conn.dialect.driver != "psycopg":
+        params = [dict(zip(cols, r)) for r in rows]
+        return conn.execute(plan.stmt, params).rowcount if params else 0
+
+    # Text format: columns are mostly Text-mapped, and binary COPY would need
+    # exact wire types (e.g. uuid.UUID into a text column fails).
+    prep = conn.dialect.identifier_preparer
+    sql = f"COPY {prep.format_table(tbl)} ({', '.join(prep.quote(c) for c in cols)}) FROM STDIN"
+    count = 0
+    with conn.connection.driver_connection.cursor() as cur, cur.copy(sql) as copy:
+        for row in rows:
+            copy.write_row(row)
+            count += 1
+    return count
+
+
+_WRITE_KINDS = ("insert", "update", "delete")
+
+
+def _run_writes(db: DB, plans: Sequence[QueryPlan]) -> int:
+    """
+    Run several write plans atomically and return the last statement's rowcount.
+
+    On Postgres the earlier writes ride along as data-modifying CTEs of the last one,
+    so the whole group is a single statement and round trip. All parts then see the
+    same snapshot: they must not depend on each other's rows (e.g. via RETURNING).
+    """
+    with _connection(db, write=True) as conn:
+        if db.engine.dialect.name == "postgresql" and all(p.params is None for p in plans):
+            *head, last = plans
+            stmt = last.stmt.add_cte(*(p.stmt.cte(f"w{i}") for i, p in enumerate(head)))
+            return conn.execute(stmt).rowcount
+
+        res = None
+        for p in plans:
+            if p.params is None:
+                res = conn.execute(p.stmt)
+                continue
+            for stmt in _insert_chunks(p.stmt, p.params):
+                res = conn.execute(stmt)
+        return res.rowcount if res is not None else 0
+
+
 def query(fn: Callable[P, R]) -> Callable[P, R]:
-    """Decorator that executes a query plan returned from a function."""
+    """
+    Decorator that executes a query plan returned from a function.
+
+    Returning a tuple of write plans (insert/update/delete) runs them in one transaction.
+    """
     return_type = fn.__annotations__.get("return", inspect._empty)
 
     @wraps(fn)
@@ -777,6 +1221,14 @@ def query(fn: Callable[P, R]) -> Callable[P, R]:
         _TLS.last_plan = None
 
         out = fn(*args, **kwargs)
+        if isinstance(out, tuple) and out and all(isinstance(p, QueryPlan) for p in out):
+            if not all(p.kind in _WRITE_KINDS for p in out):
+                raise RuntimeError(f"{fn.__name__}: only write plans can be grouped into one transaction")
+            rowcount = _run_writes(get_db(), out)
+            if return_type in (None, inspect._empty, type(None)):
+                return None  # type: ignore[return-value]
+            return rowcount  # type: ignore[return-value]
+
         plan = out if isinstance(out, QueryPlan) else getattr(_TLS, "last_plan", None)
         if plan is None:
             raise RuntimeError(
@@ -786,9 +1238,22 @@ def query(fn: Callable[P, R]) -> Callable[P, R]:
 
         db = get_db()
 
+        if plan.kind == "select" and plan.mode == "iter":
+            # lazy: the connection stays checked out until the iterator is exhausted or closed
+            return _iter_rows(db, plan)  # type: ignore[return-value]
+
         if plan.kind == "select":
-            with db.engine.connect() as conn:
+            with _connection(db, write=False) as conn:
                 res = conn.execute(plan.stmt)
+                if plan.mode == "scalars":
+                    return _coerce_return(res.scalars().all(), return_type)
+                if plan.mode == "columns":
+                    keys = list(res.keys())
+                    rows = res.all()
+                    # transpose rows -> columns in one C-level pass
+                    cols = list(zip(*rows)) if rows else [() for _ in keys]
+                    return _coerce_return({k: list(c) for k, c in zip(keys, cols)}, return_type)
+
                 maps = res.mappings()
 
                 if plan.mode == "all":
@@ -811,20 +1276,38 @@ def query(fn: Callable[P, R]) -> Callable[P, R]:
                 return _coerce_return(value, return_type)
 
         if plan.kind == "insert":
-            with db.engine.begin() as conn:
-                res = conn.execute(plan.stmt)
-                return res.rowcount
-            
+            if plan.params is not None and not plan.params:
+                count = 0
+            else:
+                with _connection(db, write=True) as conn:
+                    if plan.params is None:
+                        count = conn.execute(plan.stmt).rowcount
+                    else:
+                        count = sum(
+                            conn.execute(stmt).rowcount for stmt in _insert_chunks(plan.stmt, plan.params)
+                        )
+            # if you annotate -> None, return None; otherwise return rowcount
+            if return_type in (None, inspect._empty, type(None)):
+                return None  # type: ignore[return-value]
+            return count  # type: ignore[return-value]
+
+        if plan.kind == "copy":
+            with _connection(db, write=True) as conn:
+                count = _copy_rows(conn, plan)
+                if return_type in (None, inspect._empty, type(None)):
+                    return None  # type: ignore[return-value]
+                return count  # type: ignore[return-value]
+
         if plan.kind == "scalar":
-            with db.engine.connect() as conn:
+            with _connection(db, write=False) as conn:
                 res = conn.execute(plan.stmt)
                 val = res.scalar_one()
                 if plan.cast is not None:
                     val = plan.cast(val)
                 return val  # type: ignore[return-value]
             
-        if plan.kind == "delete":
-            with db.engine.begin() as conn:
+        if plan.kind in ("update", "delete"):
+            with _connection(db, write=True) as conn:
                 res = conn.execute(plan.stmt)
                 # if you annotate -> None, return None; otherwise return rowcount
                 if return_type in (None, inspect._empty, type(None)):
@@ -845,10 +1328,18 @@ __all__ = [
     "schema",
     "table",
     "Table",
+    "UnitOfWork",
     "query",
     "Key",
     "Unique",
+    "Indexed",
+    "Searchable",
     "key",
     "unique",
+    "indexed",
+    "searchable",
+    "Now",
+    "now",
     "bindparam",
+    "uuid7",
 ]
@@ -10,31 +10,28 @@ class WebApp:
     """Serves a Vite-built SPA from backend/static.
 
     Behavior:
-    - If the requested file exists in /static, serve it.
+    - If the requested file exists in /static, CherryPy's staticdir tool serves it.
     - Otherwise, serve index.html (SPA fallback for deep links).
     """
 
     def __init__(self, static_dir: pathlib.Path) -> None:
         """Create the web app handler for a directory of static assets."""
         self.static_dir = static_dir.resolve()
+        self._index_path = _abs(self.static_dir / "index.html")
+        # staticdir runs before the handler and only falls through to
+        # index()/default() when no file matched.
+        self._cp_config = {
+            "tools.staticdir.on": True,
+            "tools.staticdir.dir": str(self.static_dir),
+            "tools.staticdir.index": "index.html",
+        }
 
     @cherrypy.expose
     def index(self):
         """Serve the SPA entrypoint."""
-        return cherrypy.lib.static.serve_file(_abs(self.static_dir / "index.html"))
+        return cherrypy.lib.static.serve_file(self._index_path)
 
     @cherrypy.expose
     def default(self, *args, **kwargs):
-        """Serve static assets when present, otherwise return the SPA shell."""
-        rel = pathlib.Path(*args) if args else pathlib.Path("index.html")
-        candidate = (self.static_dir / rel).resolve()
-
-        # Prevent path traversal
-        if self.static_dir not in candidate.parents and candidate != self.static_dir:
-            raise cherrypy.HTTPError(404)
-
-        if candidate.is_file():
-            return cherrypy.lib.static.serve_file(_abs(candidate))
-
-        # SPA fallback
-        return cherrypy.lib.static.serve_file(_abs(self.static_dir / "index.html"))
+        """Return the SPA shell for paths that are not static files."""
+        return cherrypy.lib.static.serve_file(self._index_path)
@@ -1,25 +1,65 @@
 """Dynamic endpoint/router loader for CherryPy-backed APIs and pages."""
 from __future__ import annotations
 
+import datetime
 import importlib.util
 import inspect
 import json
+import logging
 import sys
+import threading
 import typing as t
-from dataclasses import asdict, is_dataclass
+from functools import lru_cache
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
 from pathlib import Path
-from types import ModuleType
+from types import ModuleType, UnionType
+from uuid import UUID
 import os
 
 
 import cherrypy
 from typing import Any, Callable
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib json fallback
+    orjson = None  # type: ignore[assignment]
+
+_json_loads: Callable[[bytes], Any] = orjson.loads if orjson is not None else json.loads
+_json_encoder: Callable[[Any], bytes] | None = None
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:  # pragma: no cover - dev reload falls back to mtime polling
+    FileSystemEventHandler = object  # type: ignore[assignment,misc]
+    Observer = None  # type: ignore[assignment,misc]
+
 _MODULE_CACHE: dict[str, tuple[float, ModuleType]] = {}
 
+_HTML_HEAD = (
+    "<!doctype html>\n<html>\n<head>\n"
+    '<meta charset="utf-8">\n'
+    '<meta name="viewport" content="width=device-width,initial-scale=1">\n'
+)
+_HTML_BODY = '</head>\n<body>\n<div id="app"></div>\n'
+_HTML_TAIL = "</body>\n</html>"
+_LINK_TMPL = '<link rel="stylesheet" href="/assets/{}">\n'
+_SCRIPT_TMPL = '<script type="module" src="/assets/{}"></script>\n'
+
+_UNSET = object()
+_STREAM_CHUNK = 1 << 16
+
+# Route token kinds
+_STATIC = 0
+_PARAM = 1
+
 _HTTP_METHODS = {"get", "post", "put", "patch", "delete", "options", "head"}
 _ALREADY_MOUNTED = False
 _INIT_ALREADY_RUN = False
+_MOUNT_LOCK = threading.Lock()
+_INIT_LOCK = threading.Lock()
 
 
 def _find_src_root(start: Path) -> Path:
@@ -40,7 +80,13 @@ _DEFAULT_INIT_PATH = _SRC_ROOT / "init.py"
 
 
 class Endpoint:
-    """Base class for endpoint modules: class Endpoint(endpoints.Endpoint)."""
+    """
+    Base class for endpoint modules: class Endpoint(endpoints.Endpoint).
+
+    The router creates one instance per endpoint module and reuses it for every
+    request across CherryPy worker threads, so handlers and hooks must not keep
+    per-request state on self.
+    """
 
     def init(self) -> None:
         """Hook called before each request handler."""
@@ -54,15 +100,15 @@ class Endpoint:
         """Hook called after each request handler, even on errors."""
         ...
 
-    def _run(self, method: str, route_params: dict[str, str]) -> t.Any:
-        """Invoke a method with request/route-bound parameters."""
+    def _run(self, method: str, route_params: dict[str, str]) -> bytes | t.Iterator[bytes]:
+        """Invoke a method with request/route-bound parameters and encode its result."""
         self.init()
         try:
             self.auth()
             fn = getattr(self, method, None)
             if not callable(fn):
                 raise cherrypy.HTTPError(405, "Method Not Allowed")
-            return _call_with_binding(fn, route_params)
+            return _return_encoder(fn)(_call_with_binding(fn, route_params))
         finally:
             try:
                 self.cleanup()
@@ -70,6 +116,27 @@ class Endpoint:
                 pass
 
 
+class JsonStream:
+    """
+    Endpoint return value that streams an iterable as a JSON array.
+
+    With key="notes" the body is {"notes": [...]}, matching a dataclass wrapper
+    with a single list field, so clients see the same shape as a buffered response.
+    """
+
+    __slots__ = ("items", "key")
+
+    def __init__(self, items: t.Iterable[t.Any], *, key: str | None = None) -> None:
+        """Wrap an iterable of JSON-serializable items."""
+        self.items = items
+        self.key = key
+
+
+def set_json_encoder(encoder: Callable[[Any], bytes] | None) -> None:
+    """Replace the JSON encoder used for endpoint responses; None restores the default."""
+    global _json_encoder
+    _json_encoder = encoder
+
 
 def params(spec: dict[str, Any]) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Annotate endpoint methods with explicit query parameter metadata."""
@@ -82,30 +149,23 @@ def params(spec: dict[str, Any]) -> Callable[[Callable[..., Any]], Callable[...,
 def _run_init_file(init_path: str | Path | None) -> None:
     """Execute the optional init.py module once per process."""
     global _INIT_ALREADY_RUN
-    if _INIT_ALREADY_RUN:
-        return
-
-    path = Path(init_path) if init_path is not None else _DEFAULT_INIT_PATH
-    if not path.exists():
-        _INIT_ALREADY_RUN = True
-        return
-
-    spec = importlib.util.spec_from_file_location("tsunami_init", path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Failed to load init module from {path}")
-
-    module = importlib.util.module_from_spec(spec)
-    sys.modules["tsunami_init"] = module
-    spec.loader.exec_module(module)
-    _INIT_ALREADY_RUN = True
-
-
-
-
-
+    with _INIT_LOCK:
+        if _INIT_ALREADY_RUN:
+            return
 
+        path = Path(init_path) if init_path is not None else _DEFAULT_INIT_PATH
+        if not path.exists():
+            _INIT_ALREADY_RUN = True
+            return
 
+        spec = importlib.util.spec_from_file_location("tsunami_init", path)
+        if spec is None or spec.loader is None:
+            raise RuntimeError(f"Failed to load init module from {path}")
 
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["tsunami_init"] = module
+        spec.loader.exec_module(module)
+        _INIT_ALREADY_RUN = True
 
 
 def mount_api(
@@ -129,46 +189,56 @@ def mount_api(
       index.py             -> /
     """
     global _ALREADY_MOUNTED
-    if _ALREADY_MOUNTED:
-        return
-
-    if api_dir is None:
-        api_dir_path = _DEFAULT_ENDPOINT_DIR
-    else:
-        api_dir_path = Path(api_dir)
-        if not api_dir_path.is_absolute():
-            cwd_path = Path.cwd() / api_dir_path
-            api_dir_path = cwd_path if cwd_path.exists() else _SRC_ROOT / api_dir_path
-
-    if pages_dir is None:
-        pages_dir_path = _DEFAULT_PAGES_DIR
-    else:
-        pages_dir_path = Path(pages_dir)
-        if not pages_dir_path.is_absolute():
-            cwd_path = Path.cwd() / pages_dir_path
-            pages_dir_path = cwd_path if cwd_path.exists() else _SRC_ROOT / pages_dir_path
-
-    if assets_dir is None:
-        assets_dir_path = _DEFAULT_ASSETS_DIR
-    else:
-        assets_dir_path = Path(assets_dir)
-        if not assets_dir_path.is_absolute():
-            cwd_path = Path.cwd() / assets_dir_path
-            assets_dir_path = cwd_path if cwd_path.exists() else _SRC_ROOT / assets_dir_path
-
-    if run_init:
-        _run_init_file(init_path)
-
-    router = ApiRouter(
-        api_dir=api_dir_path,
-        pages_dir=pages_dir_path,
-        assets_dir=assets_dir_path,
-        dev_reload=dev_reload,
-    )
-    mount_path = "/" + api_root.strip("/")
-    cherrypy.tree.mount(router, mount_path)
+    with _MOUNT_LOCK:
+        if _ALREADY_MOUNTED:
+            return
+
+        if api_dir is None:
+            api_dir_path = _DEFAULT_ENDPOINT_DIR
+        else:
+            api_dir_path = Path(api_dir)
+            if not api_dir_path.is_absolute():
+                cwd_path = Path.cwd() / api_dir_path
+                api_dir_path = cwd_path if cwd_path.exists() else _SRC_ROOT / api_dir_path
 
-    _ALREADY_MOUNTED = True
+        if pages_dir is None:
+            pages_dir_path = _DEFAULT_PAGES_DIR
+        else:
+            pages_dir_path = Path(pages_dir)
+            if not pages_dir_path.is_absolute():
+                cwd_path = Path.cwd() / pages_dir_path
+                pages_dir_path = cwd_path if cwd_path.exists() else _SRC_ROOT / pages_dir_path
+
+        if assets_dir is None:
+            assets_dir_path = _DEFAULT_ASSETS_DIR
+        else:
+            assets_dir_path = Path(assets_dir)
+            if not assets_dir_path.is_absolute():
+                cwd_path = Path.cwd() / assets_dir_path
+                assets_dir_path = cwd_path if cwd_path.exists() else _SRC_ROOT / assets_dir_path
+
+        if run_init:
+            _run_init_file(init_path)
+
+        router = ApiRouter(
+            api_dir=api_dir_path,
+            pages_dir=pages_dir_path,
+            assets_dir=assets_dir_path,
+            dev_reload=dev_reload,
+        )
+        mount_path = "/" + api_root.strip("/")
+        cherrypy.tree.mount(
+            router,
+            mount_path,
+            {
+                "/assets": {
+                    "tools.staticdir.on": True,
+                    "tools.staticdir.dir": str(router.assets_dir),
+                },
+            },
+        )
+
+        _ALREADY_MOUNTED = True
 
 
 class ApiRouter:
@@ -191,11 +261,28 @@ class ApiRouter:
         self._dev_reload = dev_reload
         self._routes = _build_route_table(self.api_dir)
         self._page_routes, self._not_found_page = _build_pages_route_table(self.pages_dir)
+        self._route_index = _index_routes(self._routes)
+        self._page_route_index = _index_routes(self._page_routes)
+        self._routes_summary = _routes_summary(self.api_dir, self._routes)
         self._endpoint_cache: dict[Path, type[Endpoint]] = {}
+        self._endpoint_instances: dict[Path, Endpoint] = {}
+        # Module imports run @db.table (shared MetaData + DDL) and touch sys.path,
+        # so endpoint loading is serialized.
+        self._load_lock = threading.RLock()
         self._manifest_cache: dict[str, Any] | None = None
         self._manifest_mtime: int | None = None
-        self._routes_mtime = _dir_mtime(self.api_dir, suffixes={".py"})
-        self._pages_mtime = _dir_mtime(self.pages_dir, suffixes={".tsx"})
+        self._page_html_cache: dict[tuple[Path, int], str] = {}
+        self._dirty = threading.Event()
+        self._observer = None
+        self._routes_mtime = 0
+        self._pages_mtime = 0
+        if dev_reload:
+            self._observer = _start_route_watcher(self._dirty, [self.api_dir, self.pages_dir])
+            if self._observer is None:
+                self._routes_mtime = _dir_mtime(self.api_dir, suffixes=(".py",))
+                self._pages_mtime = _dir_mtime(self.pages_dir, suffixes=(".tsx",))
+        else:
+            self._warm_endpoints()
 
     @cherrypy.expose
     def index(self):
@@ -205,7 +292,7 @@ class ApiRouter:
         if cherrypy.request.method and cherrypy.request.method.upper() not in {"GET", "HEAD"}:
             raise cherrypy.HTTPError(405)
 
-        page_match = _match_route(self._page_routes, [])
+        page_match = _match_route(self._page_route_index, [])
         if page_match is not None:
             return self._serve_page(page_match["file"], status=200)
 
@@ -219,12 +306,7 @@ class ApiRouter:
         """Return a debug list of discovered API routes."""
         # /api/__routes  (debug)
         self._maybe_refresh_routes()
-        return _serialize(
-            {
-                "api_dir": str(self.api_dir),
-                "routes": [r["pattern"] for r in self._routes],
-            }
-        )
+        return self._routes_response()
 
     @cherrypy.expose
     def default(self, *vpath, **_params):
@@ -235,42 +317,31 @@ class ApiRouter:
         if segments and segments[0] == "api":
             api_segments = segments[1:]
             if not api_segments:
-                return _serialize(
-                    {
-                        "api_dir": str(self.api_dir),
-                        "routes": [r["pattern"] for r in self._routes],
-                    }
-                )
+                return self._routes_response()
             if len(api_segments) == 1 and api_segments[0] == "__routes":
-                return _serialize(
-                    {
-                        "api_dir": str(self.api_dir),
-                        "routes": [r["pattern"] for r in self._routes],
-                    }
-                )
+                return self._routes_response()
             method = (cherrypy.request.method or "GET").lower()
             if method not in _HTTP_METHODS:
                 raise cherrypy.HTTPError(405)
 
-            match = _match_route(self._routes, api_segments)
+            match = _match_route(self._route_index, api_segments)
             if match is not None:
-                endpoint_cls = self._load_endpoint_cls(match["file"])
-                ep: Endpoint = endpoint_cls()
-                result = ep._run(method, match["params"])
-                return _serialize(result)
+                ep = self._load_endpoint(match["file"])
+                return ep._run(method, match["params"])
 
             cherrypy.response.status = 404
             return _serialize({"error": "No matching route"})
 
         if segments and segments[0] == "assets":
-            return self._serve_asset(segments[1:])
+            # Existing files are served by tools.staticdir before dispatch.
+            raise cherrypy.HTTPError(404)
         method = (cherrypy.request.method or "GET").lower()
         if method not in _HTTP_METHODS:
             raise cherrypy.HTTPError(405)
 
         if method in {"get", "head"}:
-            page_match = _match_route(self._page_routes, segments)
-            endpoint_match = _match_route(self._routes, segments)
+            page_match = _match_route(self._page_route_index, segments)
+            endpoint_match = _match_route(self._route_index, segments)
 
             if page_match is not None:
                 if endpoint_match is not None:
@@ -280,24 +351,54 @@ class ApiRouter:
                 return self._serve_page(page_match["file"], status=200)
 
             if endpoint_match is not None:
-                endpoint_cls = self._load_endpoint_cls(endpoint_match["file"])
-                ep: Endpoint = endpoint_cls()
-                result = ep._run(method, endpoint_match["params"])
-                return _serialize(result)
+                ep = self._load_endpoint(endpoint_match["file"])
+                return ep._run(method, endpoint_match["params"])
 
             if self._not_found_page:
                 return self._serve_page(self._not_found_page, status=404)
 
             raise cherrypy.HTTPError(404, "No matching route")
 
-        match = _match_route(self._routes, segments)
+        match = _match_route(self._route_index, segments)
         if match is None:
             raise cherrypy.HTTPError(404, "No matching endpoint")
 
-        endpoint_cls = self._load_endpoint_cls(match["file"])
-        ep: Endpoint = endpoint_cls()
-        result = ep._run(method, match["params"])
-        return _serialize(result)
+        ep = self._load_endpoint(match["file"])
+        return ep._run(method, match["params"])
+
+    def _routes_response(self) -> bytes:
+        """Return the cached debug route listing as a JSON response."""
+        cherrypy.response.headers["Content-Type"] = "application/json; charset=utf-8"
+        return self._routes_summary
+
+    def _warm_endpoints(self) -> None:
+        """Import and instantiate every endpoint before serving traffic."""
+        for r in self._routes:
+            self._warm_endpoint(r["file"])
+
+    def _warm_endpoint(self, file_path: Path) -> None:
+        """Load one endpoint, logging failures so they surface on first request instead."""
+        try:
+            self._load_endpoint(file_path)
+        except Exception:
+            cherrypy.log(
+                f"Failed to preload endpoint {file_path}",
+                context="ROUTER",
+                severity=logging.WARNING,
+                traceback=True,
+            )
+
+    def _load_endpoint(self, file_path: Path) -> Endpoint:
+        """Return the shared Endpoint instance for a module path."""
+        ep = self._endpoint_instances.get(file_path)
+        if ep is not None:
+            return ep
+        with self._load_lock:
+            ep = self._endpoint_instances.get(file_path)
+            if ep is None:
+                ep = self._load_endpoint_cls(file_path)()
+                self._endpoint_instances[file_path] = ep
+        return ep
 
     def _load_endpoint_cls(self, file_path: Path) -> type[Endpoint]:
         """Load and cache the Endpoint class for a module path."""
@@ -305,14 +406,19 @@ class ApiRouter:
         if cached is not None:
             return cached
 
+        with self._load_lock:
+            cached = self._endpoint_cache.get(file_path)
+            if cached is not None:
+                return cached
 
-        mod = _load_module_from_file(file_path, api_dir=self.api_dir)
-        endpoint_cls = getattr(mod, "Endpoint", None)
-        if endpoint_cls is None or not inspect.isclass(endpoint_cls):
-            raise cherrypy.HTTPError(500, f"{file_path.name} must export class Endpoint")
+            mod = _load_module_from_file(file_path, api_dir=self.api_dir, dev_reload=self._dev_reload)
+            endpoint_cls = getattr(mod, "Endpoint", None)
+            if endpoint_cls is None or not inspect.isclass(endpoint_cls):
+                raise cherrypy.HTTPError(500, f"{file_path.name} must export class Endpoint")
 
-        self._endpoint_cache[file_path] = endpoint_cls
-        return endpoint_cls
+            _compile_binding_plans(endpoint_cls)
+            self._endpoint_cache[file_path] = endpoint_cls
+            return endpoint_cls
 
     def _tsx_route_exists(self, file_path: Path) -> bool:
         """Check if a TSX page exists for a matching endpoint path."""
@@ -326,8 +432,20 @@ class ApiRouter:
         return tsx_path.exists()
 
     def _serve_page(self, page_path: Path, *, status: int) -> str:
-        """Render a minimal HTML shell for a TSX page route."""
+        """Serve the HTML shell for a TSX page route, rendering it once per manifest."""
         manifest = self._load_manifest()
+        cache_key = (page_path, self._manifest_mtime or 0)
+        html = self._page_html_cache.get(cache_key)
+        if html is None:
+            html = self._render_page(manifest, page_path)
+            self._page_html_cache[cache_key] = html
+
+        cherrypy.response.status = status
+        cherrypy.response.headers["Content-Type"] = "text/html; charset=utf-8"
+        return html
+
+    def _render_page(self, manifest: dict[str, Any], page_path: Path) -> str:
+        """Render a minimal HTML shell for a TSX page route."""
         rel = page_path.relative_to(self.pages_dir).as_posix()
         key = rel[:-4] if rel.endswith(".tsx") else rel
 
@@ -338,124 +456,168 @@ class ApiRouter:
         scripts = _collect_js_assets(manifest, entry)
         css_files = [css for css in entry.get("css", []) if isinstance(css, str)]
 
-        html_lines: list[str] = [
-            "<!doctype html>",
-            "<html>",
-            "<head>",
-            '<meta charset="utf-8">',
-            '<meta name="viewport" content="width=device-width,initial-scale=1">',
-            f"<title>{key}</title>",
-        ]
-
-        for css in css_files:
-            css_path = css.removeprefix("assets/")
-            html_lines.append(f'<link rel="stylesheet" href="/assets/{css_path}">')
-
-        html_lines.append("</head>")
-        html_lines.append("<body>")
-        html_lines.append('<div id="app"></div>')
-
-        for script in scripts:
-            if script:
-                script_path = script.removeprefix("assets/")
-                html_lines.append(f'<script type="module" src="/assets/{script_path}"></script>')
-
-        html_lines.append("</body>")
-        html_lines.append("</html>")
-
-        cherrypy.response.status = status
-        cherrypy.response.headers["Content-Type"] = "text/html; charset=utf-8"
-        return "\n".join(html_lines)
+        links = "".join(_LINK_TMPL.format(css.removeprefix("assets/")) for css in css_files)
+        script_tags = "".join(
+            _SCRIPT_TMPL.format(script.removeprefix("assets/")) for script in scripts if script
+        )
+        return f"{_HTML_HEAD}<title>{key}</title>\n{links}{_HTML_BODY}{script_tags}{_HTML_TAIL}"
 
     def _load_manifest(self) -> dict[str, Any]:
         """Load the Vite manifest used to resolve built assets."""
+        if self._manifest_cache is not None and not self._dev_reload:
+            return self._manifest_cache
+
         manifest_path = _resolve_manifest_path(self.assets_dir)
         if manifest_path is None:
             raise cherrypy.HTTPError(500, f"Missing manifest in {self.assets_dir}")
 
         if self._manifest_cache is not None:
-            if not self._dev_reload:
-                return self._manifest_cache
             mtime = manifest_path.stat().st_mtime_ns
             if self._manifest_mtime == mtime:
                 return self._manifest_cache
 
-        self._manifest_cache = json.loads(manifest_path.read_text(encoding="utf-8"))
-        self._manifest_mtime = manifest_path.stat().st_mtime_ns
-        return self._manifest_cache
+        manifest = _json_loads(manifest_path.read_bytes())
+        mtime = manifest_path.stat().st_mtime_ns
+        # Build the new page cache before publishing it so concurrent
+        # requests only ever see a complete, read-only mapping.
+        self._page_html_cache = self._prerender_pages(manifest, mtime)
+        self._manifest_cache = manifest
+        self._manifest_mtime = mtime
+        return manifest
+
+    def _prerender_pages(self, manifest: dict[str, Any], mtime: int) -> dict[tuple[Path, int], str]:
+        """Render the HTML shell for every known page against a freshly loaded manifest."""
+        pages = [r["file"] for r in self._page_routes]
+        if self._not_found_page is not None:
+            pages.append(self._not_found_page)
+
+        cache: dict[tuple[Path, int], str] = {}
+        for page_path in pages:
+            try:
+                cache[(page_path, mtime)] = self._render_page(manifest, page_path)
+            except cherrypy.HTTPError:
+                # Missing entries are reported when the page is requested.
+                continue
+        return cache
 
     def _maybe_refresh_routes(self) -> None:
         """Rebuild route tables when files change in dev mode."""
         if not self._dev_reload:
             return
 
-        routes_mtime = _dir_mtime(self.api_dir, suffixes={".py"})
-        pages_mtime = _dir_mtime(self.pages_dir, suffixes={".tsx"})
-        if routes_mtime == self._routes_mtime and pages_mtime == self._pages_mtime:
-            return
+        if self._observer is not None:
+            if not self._dirty.is_set():
+                return
+            self._dirty.clear()
+        else:
+            # No watchdog available: poll the trees instead.
+            routes_mtime = _dir_mtime(self.api_dir, suffixes=(".py",))
+            pages_mtime = _dir_mtime(self.pages_dir, suffixes=(".tsx",))
+            if routes_mtime == self._routes_mtime and pages_mtime == self._pages_mtime:
+                return
+            self._routes_mtime = routes_mtime
+            self._pages_mtime = pages_mtime
 
         self._routes = _build_route_table(self.api_dir)
         self._page_routes, self._not_found_page = _build_pages_route_table(self.pages_dir)
-        self._routes_mtime = routes_mtime
-        self._pages_mtime = pages_mtime
+        self._route_index = _index_routes(self._routes)
+        self._page_route_index = _index_routes(self._page_routes)
+        self._routes_summary = _routes_summary(self.api_dir, self._routes)
+        self._endpoint_cache = {}
+        self._endpoint_instances = {}
         self._manifest_cache = None
         self._manifest_mtime = None
 
-    def _serve_asset(self, segments: list[str]) -> Any:
-        """Serve a static asset from the configured assets directory."""
-        rel = Path(*segments) if segments else Path()
-        candidate = (self.assets_dir / rel).resolve()
-
-        if self.assets_dir not in candidate.parents and candidate != self.assets_dir:
-            raise cherrypy.HTTPError(404)
-
-        if not candidate.is_file():
-            raise cherrypy.HTTPError(404)
-
-        return cherrypy.lib.static.serve_file(str(candidate))
-
 
 def _build_route_table(api_dir: Path) -> list[dict[str, t.Any]]:
     """Scan endpoint files and build a sorted routing table."""
     routes: list[dict[str, t.Any]] = []
 
-    for p in sorted(api_dir.rglob("*.py"), key=lambda x: str(x).lower()):
-        if "__pycache__" in p.parts:
-            continue
-        if p.name in {"__init__.py"} or p.name.startswith("_"):
+    for path in _walk_files(api_dir, ".py"):
+        if os.path.basename(path).startswith("_"):
+            # also covers __init__.py
             continue
 
-        tokens = _tokens_from_path(p, api_dir=api_dir)
-        pattern = "/" + "/".join([("{" + v + "}") if k == "param" else v for k, v in tokens])
-        pattern = pattern if pattern != "" else "/"
-
-        routes.append(
-            {
-                "file": p,
-                "tokens": tokens,
-                "pattern": pattern,
-                "param_count": sum(1 for k, _ in tokens if k == "param"),
-                "static_count": sum(1 for k, _ in tokens if k == "static"),
-            }
-        )
+        p = Path(path)
+        routes.append(_route_entry(p, _tokens_from_path(p, api_dir=api_dir)))
 
     # Prefer more specific first: static beats dynamic, then longer/static beats shorter
     routes.sort(key=lambda r: (r["param_count"], -r["static_count"], r["pattern"]))
     return routes
 
 
-def _dir_mtime(root: Path, *, suffixes: set[str] | None = None) -> int:
+def _routes_summary(api_dir: Path, routes: list[dict[str, t.Any]]) -> bytes:
+    """Encode the debug route listing once per route table build."""
+    return json.dumps(
+        {
+            "api_dir": str(api_dir),
+            "routes": [r["pattern"] for r in routes],
+        }
+    ).encode("utf-8")
+
+
+class _RouteChangeHandler(FileSystemEventHandler):
+    """Flag route tables as dirty when endpoint or page sources change."""
+
+    _EVENT_TYPES = {"created", "deleted", "modified", "moved"}
+
+    def __init__(self, dirty: threading.Event) -> None:
+        """Create a handler that sets the given event on relevant changes."""
+        super().__init__()
+        self._dirty = dirty
+
+    def on_any_event(self, event: Any) -> None:
+        """Set the dirty flag for source-file and directory-layout changes."""
+        if event.event_type not in self._EVENT_TYPES:
+            return
+        paths = [str(event.src_path), str(getattr(event, "dest_path", "") or "")]
+        if any("__pycache__" in p for p in paths):
+            return
+        if event.is_directory:
+            if event.event_type != "modified":
+                self._dirty.set()
+            return
+        if any(p.endswith((".py", ".tsx")) for p in paths):
+            self._dirty.set()
+
+
+def _start_route_watcher(dirty: threading.Event, roots: list[Path]) -> Any:
+    """Start a watchdog observer over the given roots, or return None if unavailable."""
+    if Observer is None:
+        return None
+
+    observer = Observer()
+    handler = _RouteChangeHandler(dirty)
+    for root in roots:
+        if root.exists():
+            observer.schedule(handler, str(root), recursive=True)
+    observer.daemon = True
+    observer.start()
+    cherrypy.engine.subscribe("stop", observer.stop)
+    return observer
+
+
+def _dir_mtime(root: Path, *, suffixes: tuple[str, ...] | None = None) -> int:
     """Return the newest mtime for files under root that match suffixes."""
-    if not root.exists():
-        return 0
     newest = 0
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        if suffixes is not None and path.suffix not in suffixes:
-            continue
+    stack = [str(root)]
+    while stack:
         try:
-            newest = max(newest, path.stat().st_mtime_ns)
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    if suffixes is not None and not entry.name.endswith(suffixes):
+                        continue
+                    # is_file() uses the d_type from readdir; stat() is one lstat per
+                    # matching file (cached on Windows only). Neither follows symlinks.
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    try:
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                    except OSError:
+                        continue
         except OSError:
             continue
     return newest
@@ -472,29 +634,60 @@ def _resolve_manifest_path(assets_dir: Path) -> Path | None:
     return None
 
 
-def _tokens_from_path(file_path: Path, *, api_dir: Path) -> list[tuple[str, str]]:
+def _walk_files(root: Path, suffix: str) -> list[str]:
+    """List files under root ending in suffix, skipping __pycache__, in case-insensitive path order."""
+    found: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        found.extend(os.path.join(dirpath, name) for name in filenames if name.endswith(suffix))
+    found.sort(key=str.lower)
+    return found
+
+
+def _route_entry(file_path: Path, tokens: tuple[tuple[int, str], ...]) -> dict[str, t.Any]:
+    """Build a route record with static and param slots stored as parallel tuples."""
+    static_positions = tuple(i for i, (kind, _) in enumerate(tokens) if kind == _STATIC)
+    param_positions = tuple(i for i, (kind, _) in enumerate(tokens) if kind == _PARAM)
+    pattern = "/" + "/".join([("{" + v + "}") if k == _PARAM else v for k, v in tokens])
+    return {
+        "file": file_path,
+        "pattern": pattern,
+        "segment_count": len(tokens),
+        "static_positions": static_positions,
+        "static_values": tuple(tokens[i][1] for i in static_positions),
+        "param_positions": param_positions,
+        "param_names": tuple(tokens[i][1] for i in param_positions),
+        "param_count": len(param_positions),
+        "static_count": len(static_positions),
+    }
+
+
+def _tokens_from_path(file_path: Path, *, api_dir: Path) -> tuple[tuple[int, str], ...]:
     """Convert a file path into route tokens (static/dynamic segments)."""
-    rel = file_path.relative_to(api_dir)
-
-    dir_parts = [] if str(rel.parent) == "." else list(rel.parent.parts)
-    stem_parts = [s.strip() for s in rel.stem.split(".") if s.strip()]
+    parts = os.path.relpath(file_path, api_dir).split(os.sep)
 
     # index.py at root => /api
-    if rel.name == "index.py" and not dir_parts:
-        return []
+    if len(parts) == 1 and parts[0] == "index.py":
+        return ()
+
+    return _segment_tokens(parts)
+
 
-    tokens: list[tuple[str, str]] = []
-    for seg in dir_parts + stem_parts:
+def _segment_tokens(parts: list[str]) -> tuple[tuple[int, str], ...]:
+    """Tokenize relative path parts: directories as-is, then dot-separated file stem pieces."""
+    stem = os.path.splitext(parts[-1])[0]
+    tokens: list[tuple[int, str]] = []
+    for seg in parts[:-1] + [s.strip() for s in stem.split(".") if s.strip()]:
         if seg.startswith("[") and seg.endswith("]"):
             name = seg[1:-1].strip()
             if name and not name[0].isdigit():
-                tokens.append(("param", name))
+                tokens.append((_PARAM, name))
             else:
-                tokens.append(("static", name))
+                tokens.append((_STATIC, name))
         else:
-            tokens.append(("static", seg))
+            tokens.append((_STATIC, seg))
 
-    return tokens
+    return tuple(tokens)
 
 
 def _build_pages_route_table(pages_dir: Path) -> tuple[list[dict[str, t.Any]], Path | None]:
@@ -505,55 +698,26 @@ def _build_pages_route_table(pages_dir: Path) -> tuple[list[dict[str, t.Any]], P
     if not pages_dir.exists():
         return routes, None
 
-    for p in sorted(pages_dir.rglob("*.tsx"), key=lambda x: str(x).lower()):
-        if "__pycache__" in p.parts:
-            continue
-        if p.name == "__init__.py":
-            continue
-        if p.name == "[404].tsx":
+    for path in _walk_files(pages_dir, ".tsx"):
+        p = Path(path)
+        if os.path.basename(path) == "[404].tsx":
             not_found_page = p
             continue
 
-        tokens = _tokens_from_pages_path(p, pages_dir=pages_dir)
-        pattern = "/" + "/".join([("{" + v + "}") if k == "param" else v for k, v in tokens])
-        pattern = pattern if pattern != "" else "/"
-
-        routes.append(
-            {
-                "file": p,
-                "tokens": tokens,
-                "pattern": pattern,
-                "param_count": sum(1 for k, _ in tokens if k == "param"),
-                "static_count": sum(1 for k, _ in tokens if k == "static"),
-            }
-        )
+        routes.append(_route_entry(p, _tokens_from_pages_path(p, pages_dir=pages_dir)))
 
     routes.sort(key=lambda r: (r["param_count"], -r["static_count"], r["pattern"]))
     return routes, not_found_page
 
 
-def _tokens_from_pages_path(file_path: Path, *, pages_dir: Path) -> list[tuple[str, str]]:
+def _tokens_from_pages_path(file_path: Path, *, pages_dir: Path) -> tuple[tuple[int, str], ...]:
     """Convert a page path into route tokens (static/dynamic segments)."""
-    rel = file_path.relative_to(pages_dir)
+    parts = os.path.relpath(file_path, pages_dir).split(os.sep)
 
-    dir_parts = [] if str(rel.parent) == "." else list(rel.parent.parts)
-    stem_parts = [s.strip() for s in rel.stem.split(".") if s.strip()]
+    if len(parts) == 1 and parts[0] == "[index].tsx":
+        return ()
 
-    if rel.name == "[index].tsx" and not dir_parts:
-        return []
-
-    tokens: list[tuple[str, str]] = []
-    for seg in dir_parts + stem_parts:
-        if seg.startswith("[") and seg.endswith("]"):
-            name = seg[1:-1].strip()
-            if name and not name[0].isdigit():
-                tokens.append(("param", name))
-            else:
-                tokens.append(("static", name))
-        else:
-            tokens.append(("static", seg))
-
-    return tokens
+    return _segment_tokens(parts)
 
 
 def _find_manifest_entry_by_src(manifest: dict[str, Any], src_suffix: str) -> dict[str, Any] | None:
@@ -630,44 +794,60 @@ def _collect_js_assets(manifest: dict[str, Any], entry: dict[str, Any]) -> list[
 
 def _find_asset_entry_by_prefix(assets_dir: Path, prefix: str) -> dict[str, Any] | None:
     """Fallback lookup for a JS asset entry by filename prefix."""
-    if not assets_dir.exists():
+    candidates: list[str] = []
+    try:
+        with os.scandir(assets_dir) as it:
+            for item in it:
+                if item.name.endswith(".js") and item.is_file(follow_symlinks=False):
+                    candidates.append(item.name)
+    except OSError:
         return None
 
-    candidates: list[Path] = []
-    for item in assets_dir.iterdir():
-        if item.is_file() and item.suffix == ".js":
-            candidates.append(item)
-
-    for item in sorted(candidates):
-        if item.name.startswith(f"{prefix}-") or item.stem == prefix:
-            return {"file": item.name}
+    for name in sorted(candidates):
+        if name.startswith(f"{prefix}-") or name[:-3] == prefix:
+            return {"file": name}
 
     return None
 
 
-def _match_route(routes: list[dict[str, t.Any]], segments: list[str]) -> dict[str, t.Any] | None:
-    """Return the first route that matches the given URL segments."""
+_RouteSlots = tuple[tuple[int, ...], tuple[str, ...], tuple[int, ...], tuple[str, ...], dict[str, t.Any]]
+_RouteIndex = tuple[dict[tuple[str, ...], dict[str, t.Any]], dict[int, list[_RouteSlots]]]
+
+
+def _index_routes(routes: list[dict[str, t.Any]]) -> _RouteIndex:
+    """Split sorted routes into a static lookup and per-length param buckets."""
+    static: dict[tuple[str, ...], dict[str, t.Any]] = {}
+    buckets: dict[int, list[_RouteSlots]] = {}
     for r in routes:
-        tokens = r["tokens"]
-        if len(tokens) != len(segments):
+        if r["param_count"] == 0:
+            # Routes are sorted by specificity, so the first one wins.
+            static.setdefault(r["static_values"], r)
             continue
+        buckets.setdefault(r["segment_count"], []).append(
+            (r["static_positions"], r["static_values"], r["param_positions"], r["param_names"], r)
+        )
+    return static, buckets
 
-        params: dict[str, str] = {}
-        ok = True
-        for (kind, val), seg in zip(tokens, segments):
-            if kind == "static":
-                if seg != val:
-                    ok = False
-                    break
-            else:
-                params[val] = seg
 
-        if ok:
+def _match_route(index: _RouteIndex, segments: list[str]) -> dict[str, t.Any] | None:
+    """Return the first route that matches the given URL segments."""
+    static, buckets = index
+    r = static.get(tuple(segments))
+    if r is not None:
+        return {"file": r["file"], "params": {}, "pattern": r["pattern"]}
+
+    bucket = buckets.get(len(segments))
+    if bucket is None:
+        return None
+
+    for static_idx, static_vals, param_idx, param_names, r in bucket:
+        if tuple([segments[i] for i in static_idx]) == static_vals:
+            params = {name: segments[i] for name, i in zip(param_names, param_idx)}
             return {"file": r["file"], "params": params, "pattern": r["pattern"]}
     return None
 
 
-def _load_module_from_file(file_path: Path, *, api_dir: Path) -> ModuleType:
+def _load_module_from_file(file_path: Path, *, api_dir: Path, dev_reload: bool = True) -> ModuleType:
     """Load a Python module from a file path with reload support."""
     backend_root = api_dir.parent  # /app/backend
     if str(backend_root) not in sys.path:
@@ -677,22 +857,23 @@ def _load_module_from_file(file_path: Path, *, api_dir: Path) -> ModuleType:
     safe = "__".join(rel.parts).replace(".", "__").replace("[", "var_").replace("]", "")
     module_name = f"backend.api.__auto__.{safe}"
 
-    # Track file mtime to avoid re-exec'ing the same module on every request
-    mtime = os.path.getmtime(file_path)
+    modules = sys.modules
+    cached = modules.get(module_name)
+    loaded_ok = cached is not None and getattr(cached, "__loaded_ok__", False)
 
-    cached = sys.modules.get(module_name)
-    if cached is not None and getattr(cached, "__loaded_ok__", False):
-        cached_mtime = getattr(cached, "__file_mtime__", None)
+    # Outside dev reload a loaded module is permanent: skip the stat entirely
+    if loaded_ok and not dev_reload:
+        return cached
 
-        # If unchanged, reuse the module and DO NOT exec again
-        if cached_mtime == mtime:
-            return cached
+    # Track file mtime to avoid re-exec'ing the same module on every request
+    mtime = os.path.getmtime(file_path)
 
-        # File changed (dev reload): toss the old module so we can re-import cleanly
-        sys.modules.pop(module_name, None)
+    # If unchanged, reuse the module and DO NOT exec again
+    if loaded_ok and getattr(cached, "__file_mtime__", None) == mtime:
+        return cached
 
-    # If we have a partial/bad module lying around, remove it
-    sys.modules.pop(module_name, None)
+    # File changed (dev reload) or a partial/bad module is lying around: remove it
+    modules.pop(module_name, None)
 
     spec = importlib.util.spec_from_file_location(module_name, file_path)
     if spec is None or spec.loader is None:
@@ -701,7 +882,7 @@ def _load_module_from_file(file_path: Path, *, api_dir: Path) -> ModuleType:
     mod = importlib.util.module_from_spec(spec)
 
     # Insert before exec to support circular imports
-    sys.modules[module_name] = mod
+    modules[module_name] = mod
 
     try:
         spec.loader.exec_module(mod)
@@ -710,15 +891,17 @@ def _load_module_from_file(file_path: Path, *, api_dir: Path) -> ModuleType:
         return mod
     except Exception:
         # CRITICAL: don't leave a half-imported module in sys.modules
-        sys.modules.pop(module_name, None)
+        modules.pop(module_name, None)
         raise
 
 
 
-def _serialize(obj: t.Any) -> bytes:
+def _serialize(obj: t.Any) -> bytes | t.Iterator[bytes]:
     """Serialize endpoint output to bytes, defaulting to JSON."""
     if obj is None:
         cherrypy.response.status = 204
+        # No body, so drop CherryPy's default text/html content type.
+        cherrypy.response.headers.pop("Content-Type", None)
         return b""
 
     if isinstance(obj, (bytes, bytearray)):
@@ -726,17 +909,61 @@ def _serialize(obj: t.Any) -> bytes:
     if isinstance(obj, str):
         return obj.encode("utf-8")
 
-    obj = _dataclass_to_plain(obj)
-
     cherrypy.response.headers["Content-Type"] = "application/json; charset=utf-8"
-    return json.dumps(obj).encode("utf-8")
+    if isinstance(obj, JsonStream):
+        cherrypy.response.stream = True
+        return _json_array_chunks(obj.items, obj.key)
+    return _encode_json(obj)
+
+
+def _encode_json(obj: t.Any) -> bytes:
+    """Encode a value as JSON bytes."""
+    if _json_encoder is not None:
+        return _json_encoder(obj)
+    if orjson is not None:
+        # orjson walks dataclasses natively, so no intermediate dict copy
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(_dataclass_to_plain(obj), default=_json_default).encode("utf-8")
+
+
+def _json_array_chunks(items: t.Iterable[t.Any], key: str | None) -> t.Iterator[bytes]:
+    """Yield a JSON array (optionally wrapped in {key: ...}) in roughly fixed-size chunks."""
+    buf = bytearray(b"{" + _encode_json(key) + b":[" if key is not None else b"[")
+    sep = b""
+    for item in items:
+        buf += sep
+        buf += _encode_json(item)
+        sep = b","
+        if len(buf) >= _STREAM_CHUNK:
+            yield bytes(buf)
+            buf.clear()
+    buf += b"]}" if key is not None else b"]"
+    yield bytes(buf)
+
+
+def _json_default(value: t.Any) -> t.Any:
+    """Encode values the JSON encoder does not handle natively."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal, Path)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=None)
+def _plain_fields(cls: type) -> tuple[str, ...]:
+    """Return a dataclass's field names, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
 
 
 def _dataclass_to_plain(x: t.Any) -> t.Any:
     """Recursively convert dataclasses to plain dicts/lists."""
-    if is_dataclass(x):
-        return {k: _dataclass_to_plain(v) for k, v in asdict(x).items()}
-    if isinstance(x, list):
+    if is_dataclass(x) and not isinstance(x, type):
+        # Single pass over the cached schema; asdict() deep-copies and is walked again.
+        return {k: _dataclass_to_plain(getattr(x, k)) for k in _plain_fields(type(x))}
+    if isinstance(x, (list, tuple)):
         return [_dataclass_to_plain(v) for v in x]
     if isinstance(x, dict):
         return {k: _dataclass_to_plain(v) for k, v in x.items()}
@@ -745,7 +972,7 @@ def _dataclass_to_plain(x: t.Any) -> t.Any:
 
 def _call_with_binding(fn: t.Callable[..., t.Any], route_params: dict[str, str]) -> t.Any:
     """Bind request parameters/body to a callable and invoke it."""
-    sig = inspect.signature(fn)
+    plan = _binding_plan(fn)
 
     merged: dict[str, t.Any] = dict(getattr(cherrypy.request, "params", {}) or {})
     merged.update(route_params)
@@ -755,53 +982,118 @@ def _call_with_binding(fn: t.Callable[..., t.Any], route_params: dict[str, str])
         for k, v in body.items():
             merged.setdefault(k, v)
 
+    kwargs: dict[str, t.Any] = {}
+    for name, coerce, default, root_bind in plan:
+        if name in merged:
+            kwargs[name] = coerce(merged[name])
+        elif root_bind and isinstance(body, (dict, list)):
+            # convenience: single dataclass (or list of them) param can bind from root body
+            if isinstance(body, dict):
+                # keys that bind sibling params (e.g. book_title) are not model fields
+                body = {k: v for k, v in body.items() if not any(k == p[0] for p in plan)}
+            kwargs[name] = coerce(body)
+        elif default is not inspect.Parameter.empty:
+            kwargs[name] = default
+        else:
+            raise cherrypy.HTTPError(400, f"Missing param: {name}")
+
+    return fn(**kwargs)
+
+
+_BindingPlan = list[tuple[str, t.Callable[[t.Any], t.Any], t.Any, bool]]
+
+
+def _binding_plan(fn: t.Callable[..., t.Any]) -> _BindingPlan:
+    """Return the precompiled binding plan for a handler, building it once."""
     func = getattr(fn, "__func__", fn)
+    plan = getattr(func, "_binding_plan", None)
+    if plan is not None:
+        return plan
+
+    sig = inspect.signature(func)
     try:
         hints = t.get_type_hints(func, globalns=getattr(func, "__globals__", None), localns=None)
     except Exception:
         hints = {}
 
-    kwargs: dict[str, t.Any] = {}
     nonself_params = [p for p in sig.parameters.values() if p.name != "self"]
-    for name, p in sig.parameters.items():
-        if name == "self":
-            continue
+    anns = [hints.get(p.name, p.annotation) for p in nonself_params]
+    # the root body binds to the one body-shaped param; others come from query/route params
+    body_params = [p.name for p, ann in zip(nonself_params, anns) if _binds_body(ann)]
+    plan = []
+    for p, ann in zip(nonself_params, anns):
+        root_bind = len(body_params) == 1 and body_params[0] == p.name
+        plan.append((p.name, _coercer_for(ann), p.default, root_bind))
 
-        ann = hints.get(name, p.annotation)
+    try:
+        func._binding_plan = plan
+        func._return_encoder = _encoder_for(hints.get("return", sig.return_annotation))
+    except AttributeError:
+        pass
+    return plan
 
-        if name in merged:
-            raw = merged[name]
-        else:
-            # convenience: single dataclass param can bind from root body
-            if len(nonself_params) == 1 and _is_dataclass_type(ann) and isinstance(body, dict):
-                raw = body
-            elif p.default is not inspect._empty:
-                raw = p.default
-            else:
-                raise cherrypy.HTTPError(400, f"Missing param: {name}")
 
-        kwargs[name] = _coerce(raw, ann)
+def _return_encoder(fn: t.Callable[..., t.Any]) -> t.Callable[[t.Any], bytes | t.Iterator[bytes]]:
+    """Return the response encoder picked for a handler's return annotation."""
+    func = getattr(fn, "__func__", fn)
+    encoder = getattr(func, "_return_encoder", None)
+    if encoder is None:
+        _binding_plan(fn)
+        encoder = getattr(func, "_return_encoder", _serialize)
+    return encoder
+
 
-    return fn(**kwargs)
+def _encoder_for(ann: t.Any) -> t.Callable[[t.Any], bytes | t.Iterator[bytes]]:
+    """Pick a response encoder for a handler return annotation."""
+    if ann is bytes:
+        return _encode_bytes
+    if ann is str:
+        return _encode_str
+    return _serialize
+
+
+def _encode_bytes(value: t.Any) -> bytes:
+    """Pass through bytes from handlers annotated ``-> bytes``."""
+    if type(value) is bytes:
+        return value
+    return _serialize(value)
+
+
+def _encode_str(value: t.Any) -> bytes:
+    """Encode text from handlers annotated ``-> str``."""
+    if type(value) is str:
+        return value.encode("utf-8")
+    return _serialize(value)
+
+
+def _compile_binding_plans(endpoint_cls: type[Endpoint]) -> None:
+    """Precompute binding plans for every HTTP handler an Endpoint defines."""
+    for name in _HTTP_METHODS:
+        fn = getattr(endpoint_cls, name, None)
+        if callable(fn):
+            _binding_plan(fn)
 
 
 def _read_json_body() -> t.Any:
     """Parse and cache a JSON request body, returning dict or None."""
-    if hasattr(cherrypy.request, "_cached_json"):
-        return getattr(cherrypy.request, "_cached_json")
+    req = cherrypy.serving.request
+    cached = getattr(req, "_cached_json", _UNSET)
+    if cached is not _UNSET:
+        return cached
 
-    ct = (cherrypy.request.headers.get("Content-Type") or "").lower()
+    ct = (req.headers.get("Content-Type") or "").lower()
     if "application/json" not in ct:
-        setattr(cherrypy.request, "_cached_json", None)
+        req._cached_json = None
         return None
 
-    raw = cherrypy.request.body.read() or b"{}"
+    raw = req.body.read() or b"{}"
     try:
-        val = json.loads(raw.decode("utf-8"))
+        # Both decoders accept UTF-8 bytes directly, skipping a decode pass
+        val = _json_loads(raw)
     except Exception:
         raise cherrypy.HTTPError(400, "Invalid JSON")
 
-    setattr(cherrypy.request, "_cached_json", val)
+    req._cached_json = val
     return val
 
 
@@ -813,25 +1105,69 @@ def _is_dataclass_type(ann: t.Any) -> bool:
         return False
 
 
-def _coerce(value: t.Any, ann: t.Any) -> t.Any:
-    """Coerce basic types and dataclasses to match a signature annotation."""
+def _binds_body(ann: t.Any) -> bool:
+    """Return True when an annotation can be filled from the whole JSON body."""
+    if _is_dataclass_type(ann):
+        return True
+    origin = t.get_origin(ann)
+    if origin is list:
+        return any(_is_dataclass_type(a) for a in t.get_args(ann))
+    if origin in (t.Union, UnionType):
+        return any(_binds_body(a) for a in t.get_args(ann))
+    return False
+
+
+def _coercer_for(ann: t.Any) -> t.Callable[[t.Any], t.Any]:
+    """Pick the callable that coerces raw values to a signature annotation."""
     if ann in (None, inspect._empty):
-        return value
+        return _identity
 
     if _is_dataclass_type(ann):
-        if isinstance(value, dict):
-            return ann(**value)
-        return value
+        return lambda value: ann(**value) if isinstance(value, dict) else value
+
+    origin = t.get_origin(ann)
+    if origin is list:
+        args = t.get_args(ann)
+        item = _coercer_for(args[0]) if args else _identity
+        return lambda value: [item(v) for v in value] if isinstance(value, list) else value
+    if origin in (t.Union, UnionType):
+        return _union_coercer(t.get_args(ann))
 
     if ann is int:
-        return int(value)
+        return int
     if ann is float:
-        return float(value)
+        return float
     if ann is bool:
-        if isinstance(value, bool):
-            return value
-        return str(value).lower() in {"1", "true", "yes", "y"}
+        return _to_bool
     if ann is str:
-        return str(value)
+        return str
+
+    return _identity
 
+
+def _union_coercer(args: tuple[t.Any, ...]) -> t.Callable[[t.Any], t.Any]:
+    """Coerce JSON objects and arrays to the matching member of a union annotation."""
+    for_dict = next((_coercer_for(a) for a in args if _is_dataclass_type(a)), _identity)
+    for_list = next((_coercer_for(a) for a in args if t.get_origin(a) is list), _identity)
+
+    def coerce(value: t.Any) -> t.Any:
+        """Dispatch on the decoded JSON shape."""
+        if isinstance(value, dict):
+            return for_dict(value)
+        if isinstance(value, list):
+            return for_list(value)
+        return value
+
+    return coerce
+
+
+def _identity(value: t.Any) -> t.Any:
+    """Return a value unchanged."""
     return value
+
+
+def _to_bool(value: t.Any) -> bool:
+    """Interpret query/body values such as "1"/"true"/"yes" as booleans."""
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in {"1", "true", "yes", "y"}
@@ -19,6 +19,8 @@ def main() -> None:
         echo=(app_env == "dev"),
         wait=True,
         sync=True,
+        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
     )
 
     cherrypy.config.update({
@@ -1,9 +1,21 @@
 import tsunami as nami
+from tsunami import db
 from utils import notes as note
 
 class Endpoint(nami.Endpoint):
-    def get(self) -> note.Notes:
-        return note.Queries.get_notes()
+    def get(self) -> nami.JsonStream:
+        return nami.JsonStream(note.Queries.stream_notes(), key="notes")
 
-    def post(self, payload: note.NoteInsert) -> None:
-        note.Queries.add_note(payload)
+    def post(
+        self,
+        payload: note.NoteInsert | list[note.NoteInsert],
+        book_title: str | None = None,
+    ) -> None:
+        # one transaction per request; Endpoint instances are shared, so not on self
+        with db.UnitOfWork():
+            if isinstance(payload, list):
+                note.Queries.add_notes(payload)
+            elif book_title is not None:
+                note.Queries.add_note_to_notebook(payload, book_title)
+            else:
+                note.Queries.add_note(payload)
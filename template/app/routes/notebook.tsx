@@ -30,7 +30,6 @@ export default function() {
             title: "New Note",
             body: "body???",
             test: "",
-            created_at: new Date().toISOString(),
           });
         }}
       >
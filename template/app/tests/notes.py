@@ -1,3 +1,6 @@
+from utils import notes as note
+
+
 class Suite:
     def setup(self):
         pass
@@ -7,4 +10,7 @@ class Suite:
 
     class Tests:
         def create_note(self, expects):
-            return expects.condition(True)
\ No newline at end of file
+            return expects.condition(True)
+
+        def add_notes_empty_batch(self, expects):
+            return expects.condition(note.Queries.add_notes([]) is None)
\ No newline at end of file
@@ -1,5 +1,7 @@
-from dataclasses import dataclass
-from uuid import UUID, uuid4
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
 
 from tsunami import db
 
@@ -8,32 +10,41 @@ type Result[T] = T
 type Pair[T, U] = tuple[T, U]
 
 
-@dataclass
+@dataclass(slots=True)
 class NoteInsert:
-    title: db.Unique[str]
+    title: db.Unique[db.Searchable[str]]
     body: str
     test: str
-    created_at: str
+    created_at: db.Indexed[db.Now[datetime]] | None = None
 
 @db.table
 @dataclass
 class Note(NoteInsert):
-    id: db.Key[NoteId]
+    id: db.Key[NoteId] = field(default_factory=db.uuid7)
 
-@db.table
+# One row per (notebook, note); the composite unique index also serves
+# lookups by book_title alone.
+@db.table(unique=[("book_title", "note_id")])
 @dataclass
 class Notebook:
     id: db.Key[UUID]
-    book_title: db.Unique[str]
-    note_id: NoteId
+    book_title: str
+    note_id: db.Indexed[NoteId]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Notes:
-    notes: list[Note]
+    notes: tuple[Note, ...]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class NoteColumns:
+    title: tuple[str, ...]
+    body: tuple[str, ...]
+    test: tuple[str, ...]
+    created_at: tuple[datetime, ...]
+
+@dataclass(slots=True, frozen=True)
 class NotebookTitles:
-    book_titles: list[str]
+    book_titles: tuple[str, ...]
 
 
 
@@ -45,22 +56,71 @@ class Queries:
         with db.Table(Note) as notes:
             return Notes(notes.fetch_all())
 
+    @db.query
+    def get_note_columns() -> NoteColumns:
+        with db.Table(Note) as notes:
+            return notes.select("title", "body", "test", "created_at").fetch_columns()
+
+    @db.query
+    def stream_notes() -> Iterator[Note]:
+        with db.Table(Note) as notes:
+            return notes.fetch_iter()
+
     @db.query
     def get_5_notes() -> Notes:
         with db.Table(Note) as notes:
-            return Notes(notes.fetch_amount(5))
+            return Notes(notes.order_by(notes.created_at.desc()).fetch_amount(5))
 
     @db.query
     def add_note(note: NoteInsert) -> None:
         with db.Table(Note) as notes:
             notes.insert(Note(
-                uuid4(),
-                note.title,
-                note.body,
-                note.test,
-                note.created_at,
+                id=db.uuid7(),
+                title=note.title,
+                body=note.body,
+                test=note.test,
             ))
 
+    @db.query
+    def add_notes(batch: list[NoteInsert]) -> None:
+        with db.Table(Note) as notes:
+            notes.insert_many([
+                Note(
+                    id=db.uuid7(),
+                    title=note.title,
+                    body=note.body,
+                    test=note.test,
+                )
+                for note in batch
+            ])
+
+    @db.query
+    def bulk_load_notes(batch: Iterable[NoteInsert]) -> None:
+        with db.Table(Note) as notes:
+            notes.copy_rows(
+                Note(
+                    id=db.uuid7(),
+                    title=note.title,
+                    body=note.body,
+                    test=note.test,
+                )
+                for note in batch
+            )
+
+    @db.query
+    def add_note_to_notebook(note: NoteInsert, book_title: str) -> None:
+        note_id = db.uuid7()
+        with db.Table([Note, Notebook]) as (notes, notebook):
+            return (
+                notes.insert(Note(
+                    id=note_id,
+                    title=note.title,
+                    body=note.body,
+                    test=note.test,
+                )),
+                notebook.insert(Notebook(id=db.uuid7(), book_title=book_title, note_id=note_id)),
+            )
+
     @db.query
     def remove_note(title: str) -> None:
         with db.Table(Note) as notes:
@@ -69,7 +129,7 @@ class Queries:
     @db.query
     def update_notebook(book_title: str, note: Note) -> None:
         with db.Table(Notebook) as notebook:
-            notebook.insert(UUID(), book_title, note.id)
+            notebook.insert(Notebook(id=db.uuid7(), book_title=book_title, note_id=note.id))
 
     @db.query
     def get_notebook_notes(book_title: str) -> Notes:
@@ -84,7 +144,7 @@ class Queries:
     @db.query
     def get_notebooks() -> NotebookTitles:
         with db.Table(Notebook) as notebook:
-            return NotebookTitles(notebook.select("book_title").fetch_all())
+            return NotebookTitles(notebook.select("book_title").distinct().fetch_scalars())
 
     @db.query
     def get_notebook_page_count(book_title: str) -> int:
@@ -104,4 +164,4 @@ class Queries:
     @db.query
     def search_notebook(query: str) -> Notes:
         with db.Table(Note) as notes:
-            return Notes(notes.pattern(query, on=[notes.title]).fetch_all())
+            return Notes(notes.search(query, on=notes.title, prefix=True).fetch_all())